@@ -1,6 +1,6 @@
 # File: gui_components/device_selector.py
 
-from PyQt5.QtWidgets import QHBoxLayout, QLabel, QComboBox
+from PyQt5.QtWidgets import QHBoxLayout, QLabel, QComboBox, QPushButton
 
 
 class DeviceSelector:
@@ -12,8 +12,13 @@ class DeviceSelector:
         self.devices = devices
         self.default_device = default_device
         self.device_combo = QComboBox()
+        self.refresh_button = QPushButton("Refresh Devices")
 
-    def create(self):
+    def create(self, refresh_callback=None):
+        """
+        Creates the device row. ``refresh_callback`` is bound to the
+        Refresh Devices button, which is only shown when one is given.
+        """
         layout = QHBoxLayout()
         label = QLabel("Select Input Device:")
         
@@ -32,4 +37,21 @@ class DeviceSelector:
 
         layout.addWidget(label)
         layout.addWidget(self.device_combo)
+        if refresh_callback is not None:
+            self.refresh_button.clicked.connect(refresh_callback)
+            layout.addWidget(self.refresh_button)
         return layout
+
+    def set_devices(self, devices):
+        """
+        Replaces the listed devices, keeping the current entry selected. If
+        that entry came from the old list and is gone from the new one (e.g.
+        the placeholder), the default device is selected when listed.
+        """
+        current = self.device_combo.currentText()
+        if current in self.devices and current not in devices and self.default_device in devices:
+            current = self.default_device
+        self.devices = devices
+        self.device_combo.clear()
+        self.device_combo.addItems(devices)
+        self.device_combo.setCurrentText(current)
@@ -12,46 +12,140 @@ class ParameterControls(QWidget):
         self.form_layout = QFormLayout()
         self.setLayout(self.form_layout)
         self.controls = {}  # Store controls per parameter
+        self._row_keys = []  # _param_key() of each form row, in row order
+        self._value_labels = {}  # Slider value labels per parameter
+        self._callback = None
+
+    @staticmethod
+    def _is_supported(param):
+        if param["type"] in ["int", "float", "bool", "file"] or (param["type"] == "str" and "options" in param):
+            return True
+        logging.warning(f"Unsupported parameter type: {param['type']}")
+        return False
+
+    @staticmethod
+    def _param_key(param):
+        """Everything a control is built from except its current value."""
+        return (
+            param["name"], param["type"], param.get("label"), param.get("min"),
+            param.get("max"), param.get("step"), tuple(param.get("options", ())),
+        )
 
     def update_parameters(self, parameters, current_params, callback):
         """
         Updates the parameter controls dynamically based on the selected style.
 
+        Controls whose parameter definition is unchanged are kept and only
+        get the new value; the rest are removed or created (see
+        update_parameters_diff). Everything is rebuilt if the callback changes
+        or the kept controls would end up in a different order.
+
         Args:
             parameters (list): List of parameter definitions.
             current_params (dict): Current parameter values.
             callback (function): Function to call when a parameter is updated.
         """
-        logging.debug("Clearing existing controls...")
-        self.clear_layout()
-
-        self.controls = {}  # Reset controls dictionary
-
-        # Retrieve current color_mode to handle RGB sliders later
-        color_mode = current_params.get("color_mode", "White")  # Default to White
-
-        for param in parameters:
-            label = QLabel(param.get("label", "Unknown Parameter"))
+        parameters = [param for param in parameters if self._is_supported(param)]
+        keys = [self._param_key(param) for param in parameters]
+        new_keys = set(keys)
+        old_keys = set(self._row_keys)
+        kept_order = [key for key in keys if key in old_keys]
+        # Bound methods are recreated on every access, so compare with ==
+        if callback == self._callback and kept_order == [key for key in self._row_keys if key in new_keys]:
+            self.update_parameters_diff(
+                add=[(row, param) for row, (key, param) in enumerate(zip(keys, parameters)) if key not in old_keys],
+                remove=[row for row, key in enumerate(self._row_keys) if key not in new_keys],
+                keep=[param for key, param in zip(keys, parameters) if key in old_keys],
+                current_params=current_params,
+                callback=callback,
+            )
+        else:
+            logging.debug("Clearing existing controls...")
+            self.clear_layout()
 
-            if param["type"] in ["int", "float"]:
-                logging.debug(f"Adding slider for parameter: {param['name']}")
-                self._add_slider_control(param, current_params, callback, label)
+            self.controls = {}  # Reset controls dictionary
+            self._row_keys = []
+            self._value_labels = {}
+            self._callback = callback
 
-            elif param["type"] == "str" and "options" in param:
-                logging.debug(f"Adding combobox for parameter: {param['name']}")
-                self._add_combobox_control(param, current_params, callback, label)
+            for row, param in enumerate(parameters):
+                self._add_control(param, current_params, callback, row)
 
-            elif param["type"] == "bool":
-                logging.debug(f"Adding checkbox for parameter: {param['name']}")
-                self._add_checkbox_control(param, current_params, callback, label)
+        self._update_rgb_enabled(current_params)
+        logging.debug(f"Finished adding controls for parameters: {list(self.controls.keys())}")
 
-            # Add file path picker for 'file' type parameters
-            elif param["type"] == "file":
-                logging.debug(f"Adding file picker for parameter: {param['name']}")
-                self._add_file_picker_control(param, current_params, callback, label)
+    def update_parameters_diff(self, add, remove, keep, current_params, callback):
+        """
+        Applies a parameter change without rebuilding the unchanged controls.
 
-            else:
-                logging.warning(f"Unsupported parameter type: {param['type']}")
+        Args:
+            add (list): ``(row, param)`` pairs to create, row being the final form row.
+            remove (list): Form rows to delete, as indices into the current rows.
+            keep (list): Parameter definitions whose controls stay and take the new value.
+            current_params (dict): Current parameter values.
+            callback (function): Function to call when a parameter is updated.
+        """
+        for row in sorted(remove, reverse=True):
+            name = self._row_keys.pop(row)[0]
+            self.controls.pop(name, None)
+            self._value_labels.pop(name, None)
+            self.form_layout.removeRow(row)
+
+        for param in keep:
+            self._set_control_value(param, current_params)
+
+        for row, param in sorted(add, key=lambda entry: entry[0]):
+            self._add_control(param, current_params, callback, row)
+
+    def _add_control(self, param, current_params, callback, row):
+        """Create the control for one supported parameter at the given form row."""
+        label = QLabel(param.get("label", "Unknown Parameter"))
+
+        if param["type"] in ["int", "float"]:
+            logging.debug(f"Adding slider for parameter: {param['name']}")
+            self._add_slider_control(param, current_params, callback, label, row)
+
+        elif param["type"] == "str" and "options" in param:
+            logging.debug(f"Adding combobox for parameter: {param['name']}")
+            self._add_combobox_control(param, current_params, callback, label, row)
+
+        elif param["type"] == "bool":
+            logging.debug(f"Adding checkbox for parameter: {param['name']}")
+            self._add_checkbox_control(param, current_params, callback, label, row)
+
+        # Add file path picker for 'file' type parameters
+        elif param["type"] == "file":
+            logging.debug(f"Adding file picker for parameter: {param['name']}")
+            self._add_file_picker_control(param, current_params, callback, label, row)
+
+        self._row_keys.insert(row, self._param_key(param))
+
+    def _set_control_value(self, param, current_params):
+        """Show a new value on a kept control without reporting it as a user change."""
+        control = self.controls.get(param["name"])
+        if control is None:
+            return
+        value = current_params.get(param["name"], param.get("default"))
+        control.blockSignals(True)
+        try:
+            if isinstance(control, QSlider):
+                is_float = param["type"] == "float"
+                slider_value = int(value * 10) if is_float else int(value)
+                control.setValue(slider_value)
+                self._value_labels[param["name"]].setText(str(slider_value / 10) if is_float else str(slider_value))
+            elif isinstance(control, QComboBox):
+                index = control.findText(value, Qt.MatchFixedString)
+                control.setCurrentIndex(index if index >= 0 else 0)
+            elif isinstance(control, QCheckBox):
+                control.setChecked(value)
+            elif isinstance(control, QLineEdit):
+                control.setText(value)
+        finally:
+            control.blockSignals(False)
+
+    def _update_rgb_enabled(self, current_params):
+        # Retrieve current color_mode to handle RGB sliders
+        color_mode = current_params.get("color_mode", "White")  # Default to White
 
         # Ensure RGB sliders are enabled only if color_mode is "Custom"
         is_custom = color_mode == "Custom"
@@ -67,9 +161,7 @@ class ParameterControls(QWidget):
                         if isinstance(widget, QSlider):
                             widget.setEnabled(is_custom)
 
-        logging.debug(f"Finished adding controls for parameters: {list(self.controls.keys())}")
-
-    def _add_slider_control(self, param, current_params, callback, label):
+    def _add_slider_control(self, param, current_params, callback, label, row=-1):
         """
         Add a slider control for numeric parameters (int or float).
 
@@ -78,6 +170,7 @@ class ParameterControls(QWidget):
             current_params (dict): Current parameter values.
             callback (function): Function to call when the value changes.
             label (QLabel): The label widget for the parameter.
+            row (int): Form row to insert at; -1 appends.
         """
         slider_layout = QHBoxLayout()
         slider = QSlider(Qt.Horizontal)
@@ -108,12 +201,13 @@ class ParameterControls(QWidget):
 
         slider_layout.addWidget(slider)
         slider_layout.addWidget(value_label)
-        self.form_layout.addRow(label, slider_layout)
+        self.form_layout.insertRow(row, label, slider_layout)
 
         # Store control reference
         self.controls[param["name"]] = slider
+        self._value_labels[param["name"]] = value_label
 
-    def _add_combobox_control(self, param, current_params, callback, label):
+    def _add_combobox_control(self, param, current_params, callback, label, row=-1):
         """
         Adds a dropdown control for string parameters.
 
@@ -122,6 +216,7 @@ class ParameterControls(QWidget):
             current_params (dict): Current parameter values.
             callback (function): Function to call when the selection changes.
             label (QLabel): The label widget for the parameter.
+            row (int): Form row to insert at; -1 appends.
         """
         combo = QComboBox()
         combo.addItems(param["options"])
@@ -174,11 +269,11 @@ class ParameterControls(QWidget):
         # ✅ Correctly connect the combobox change event to on_color_mode_change()
         combo.currentTextChanged.connect(on_color_mode_change)
 
-        self.form_layout.addRow(label, combo)
+        self.form_layout.insertRow(row, label, combo)
         self.controls[param["name"]] = combo
         logging.debug(f"Added combobox control for {param['name']} with options {param['options']}")
 
-    def _add_checkbox_control(self, param, current_params, callback, label):
+    def _add_checkbox_control(self, param, current_params, callback, label, row=-1):
         """
         Adds a checkbox control for boolean parameters.
 
@@ -187,6 +282,7 @@ class ParameterControls(QWidget):
             current_params (dict): Current parameter values.
             callback (function): Function to call when the state changes.
             label (QLabel): The label widget for the parameter.
+            row (int): Form row to insert at; -1 appends.
         """
         checkbox = QCheckBox()
         checkbox.setChecked(current_params.get(param["name"], param["default"]))
@@ -214,11 +310,11 @@ class ParameterControls(QWidget):
 
         checkbox.stateChanged.connect(on_checkbox_state_change)
 
-        self.form_layout.addRow(label, checkbox)
+        self.form_layout.insertRow(row, label, checkbox)
         self.controls[param["name"]] = checkbox
         logging.debug(f"Added checkbox control for {param['name']}")
 
-    def _add_file_picker_control(self, param, current_params, callback, label):
+    def _add_file_picker_control(self, param, current_params, callback, label, row=-1):
         """
         Add a file picker control for file path parameters.
         """
@@ -238,7 +334,7 @@ class ParameterControls(QWidget):
         button.clicked.connect(on_browse)
         layout.addWidget(editor)
         layout.addWidget(button)
-        self.form_layout.addRow(label, layout)
+        self.form_layout.insertRow(row, label, layout)
         self.controls[param['name']] = editor
 
     def clear_layout(self):
@@ -6,15 +6,20 @@ from PyQt5.QtCore import pyqtSignal
 class StyleTabManager(QTabWidget):
     """
     A GUI component that manages style selection with categorization using tabs.
+
+    It never reads or writes the application settings: ``current_style`` is
+    the style to preselect, and selections are reported through
+    ``style_changed`` (and ``on_change``, if given) for the owner to persist.
     """
     style_changed = pyqtSignal(str)  # Signal emits the style name
 
-    def __init__(self, parent, style_categories, style_instances, settings):
+    def __init__(self, parent, style_categories, style_instances, current_style=None, on_change=None):
         super().__init__(parent)
         self.style_categories = style_categories
         self.style_instances = style_instances
-        self.settings = settings
-        self.current_style = settings.get("style", "Original")
+        self.current_style = current_style or "Original"
+        if on_change is not None:
+            self.style_changed.connect(on_change)
         self.init_tabs()
 
     def init_tabs(self):
@@ -32,6 +37,13 @@ class StyleTabManager(QTabWidget):
             tab.setLayout(layout)
             self.addTab(tab, category)
 
+    def update_styles(self, style_categories, style_instances):
+        """Replace the listed styles, e.g. once background discovery finishes."""
+        self.style_categories = style_categories
+        self.style_instances = style_instances
+        self.clear()
+        self.init_tabs()
+
     def on_item_clicked(self, item):
         self.current_style = item.text()
         self.style_changed.emit(self.current_style)  # Emit the style name
@@ -21,6 +21,7 @@ class StyleManager:
             # List of all style-related packages to scan
             packages_to_scan = ['styles']
             seen_classes = set()
+            seen_names: Dict[str, set] = {}  # per category, mirrors style_categories
             
             for pkg_name in packages_to_scan:
                 self.logger.debug(f"Scanning package: {pkg_name}")
@@ -54,9 +55,11 @@ class StyleManager:
                                     category = getattr(instance, "category", "Uncategorized")
                                     if category not in self.style_categories:
                                         self.style_categories[category] = []
+                                        seen_names[category] = set()
                                     
                                     # Avoid duplicate style names in the same category
-                                    if instance.name not in self.style_categories[category]:
+                                    if instance.name not in seen_names[category]:
+                                        seen_names[category].add(instance.name)
                                         self.style_categories[category].append(instance.name)
                                     
                                     self.style_instances[instance.name] = instance
@@ -1,6 +1,6 @@
 import cv2
 import numpy as np
-from styles.base import Style
+from styles.base import BOX_BLUR_MIN_KSIZE, Style, box_blur_3x
 from typing import Optional, Dict, Any
 
 
@@ -23,6 +23,11 @@ class BlurStyle(Style):
         }
     ]
 
+    # Use the box-blur approximation for large kernels
+    fast = True
+    # Only cv2 calls touch the image, so it can stay on the OpenCL device
+    use_umat = True
+
     def define_parameters(self):
         """
         Returns the list of parameters for the BlurStyle.
@@ -49,11 +54,16 @@ class BlurStyle(Style):
         # Validate and retrieve parameters
         params = self.validate_params(params)
 
-        kernel_size = params["kernel_size"]
+        return self._blur(image, params["kernel_size"])
 
+    def _blur(self, image, kernel_size):
+        """Blur with a validated kernel size; returns a new array."""
         # Ensure kernel size is odd (required for GaussianBlur)
         if kernel_size % 2 == 0:
             kernel_size += 1
 
-        blurred = cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
+        if self.fast and kernel_size > BOX_BLUR_MIN_KSIZE:
+            blurred = box_blur_3x(image, kernel_size)
+        else:
+            blurred = cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
         return blurred
@@ -1,20 +1,31 @@
 import cv2
-from styles.base import Style
+from styles.base import PointwiseStyle, cache_lut
 
-class BrightnessContrast(Style):
+class BrightnessContrast(PointwiseStyle):
     name = "Brightness & Contrast"
     category = "Adjustments"
     parameters = [
-        {"name": "brightness", "type": "int", "default": 0, "min": -100, "max": 100, "step": 5, "label": "Brightness"},
-        {"name": "contrast", "type": "float", "default": 1.0, "min": 0.5, "max": 3.0, "step": 0.1, "label": "Contrast"}
+        {"name": "brightness", "type": "int", "default": 0, "identity": 0, "min": -100, "max": 100, "step": 5, "label": "Brightness"},
+        {"name": "contrast", "type": "float", "default": 1.0, "identity": 1.0, "min": 0.5, "max": 3.0, "step": 0.1, "label": "Contrast"}
     ]
 
+    # LUTs keyed by (contrast, brightness), shared across instances.
+    _lut_cache = {}
+
+    def lut(self, params):
+        contrast, brightness = params["contrast"], params["brightness"]
+        # Same saturating |x * alpha + beta| as convertScaleAbs, per level
+        return cache_lut(
+            self._lut_cache, (contrast, brightness),
+            lambda: cv2.convertScaleAbs(self._IDENTITY_LUT, alpha=contrast, beta=brightness).ravel()
+        )
+
     def apply(self, image, params=None):
         if params is None:
             params = {}
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
-        brightness = params["brightness"]
-        contrast = params["contrast"]
-        adjusted = cv2.convertScaleAbs(image, alpha=contrast, beta=brightness)
+        adjusted = self.apply_lut(image, self.lut(params))
         return adjusted
@@ -1,7 +1,22 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 from styles.base import Style
 
+_EMBOSS_BASE = np.ascontiguousarray([
+    [-2, -1, 0],
+    [-1,  1, 1],
+    [0,   1, 2]
+], dtype=np.float32)
+
+
+@lru_cache(maxsize=64)
+def _emboss_kernel(scale):
+    """float32 emboss kernel pre-multiplied by scale (read-only)."""
+    kernel = _EMBOSS_BASE * np.float32(scale)
+    kernel.setflags(write=False)
+    return kernel
+
 class Emboss(Style):
     name = "Emboss"
     category = "Adjustments"
@@ -17,11 +32,7 @@ class Emboss(Style):
 
         kernel_size = params["kernel_size"]
         scale = params["scale"]
-        kernel = np.array([
-            [-2, -1, 0],
-            [-1,  1, 1],
-            [0,   1, 2]
-        ])
-        embossed = cv2.filter2D(image, -1, kernel) * scale + 128
-        embossed = np.clip(embossed, 0, 255).astype(np.uint8)
+        # Fold the scale into the kernel and the +128 bias into delta so the
+        # convolution writes the final saturated uint8 result in one pass.
+        embossed = cv2.filter2D(image, -1, _emboss_kernel(scale), dst=self._out(image.shape), delta=128)
         return embossed
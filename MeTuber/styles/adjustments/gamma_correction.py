@@ -1,9 +1,8 @@
-import cv2
 import numpy as np
-from styles.base import Style
+from styles.base import PointwiseStyle
 
 
-class GammaCorrection(Style):
+class GammaCorrection(PointwiseStyle):
     name = "Gamma Correction"
     category = "Adjustments"
     parameters = [
@@ -11,6 +10,7 @@ class GammaCorrection(Style):
             "name": "gamma",
             "type": "float",
             "default": 1.0,
+            "identity": 1.0,
             "min": 0.1,
             "max": 3.0,
             "step": 0.1,
@@ -18,13 +18,28 @@ class GammaCorrection(Style):
         }
     ]
 
+    # LUTs keyed by gamma quantized to 1/1000, shared across instances.
+    _lut_cache = {}
+
+    @classmethod
+    def _lut(cls, gamma):
+        key = int(round(gamma * 1000))
+        table = cls._lut_cache.get(key)
+        if table is None:
+            invGamma = 1000.0 / key
+            table = np.round(((np.arange(256, dtype=np.float32) / 255.0) ** invGamma) * 255.0).astype(np.uint8)
+            cls._lut_cache[key] = table
+        return table
+
+    def lut(self, params):
+        return self._lut(params["gamma"])
+
     def apply(self, image, params=None):
         if params is None:
             params = {}
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
-        gamma = params["gamma"]
-        invGamma = 1.0 / gamma
-        table = np.array([((i / 255.0) ** invGamma) * 255 for i in range(256)]).astype("uint8")
-        corrected = cv2.LUT(image, table)
+        corrected = self.apply_lut(image, self.lut(params))
         return corrected
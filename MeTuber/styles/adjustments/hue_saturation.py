@@ -11,6 +11,7 @@ class HueSaturation(Style):
             "name": "hue",
             "type": "int",
             "default": 0,
+            "identity": 0,
             "min": -50,
             "max": 50,
             "step": 1,
@@ -20,6 +21,7 @@ class HueSaturation(Style):
             "name": "saturation",
             "type": "int",
             "default": 0,
+            "identity": 0,
             "min": -50,
             "max": 50,
             "step": 1,
@@ -31,12 +33,19 @@ class HueSaturation(Style):
         if params is None:
             params = {}
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
         hue = params["hue"]
         saturation = params["saturation"]
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.int32)
-        hsv[:, :, 0] = (hsv[:, :, 0] + hue) % 180
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1] + saturation, 0, 255)
-        hsv = hsv.astype(np.uint8)
-        adjusted = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+        # Per-channel LUT: hue wraps mod 180, saturation saturates, value is
+        # untouched. Keeps the whole pass in uint8 instead of an int32 copy.
+        levels = np.arange(256, dtype=np.int16)
+        lut = np.empty((1, 256, 3), dtype=np.uint8)
+        lut[0, :, 0] = (levels + hue) % 180
+        lut[0, :, 1] = np.clip(levels + saturation, 0, 255)
+        lut[0, :, 2] = levels
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        cv2.LUT(hsv, lut, dst=hsv)
+        adjusted = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=self._out(image.shape))
         return adjusted
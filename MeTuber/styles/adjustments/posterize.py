@@ -1,3 +1,4 @@
+import cv2
 import numpy as np
 from styles.base import Style
 
@@ -24,4 +25,6 @@ class Posterize(Style):
 
         bits = params["bits"]
         shift = 8 - bits
-        poster
+        # (x >> shift) << shift is the same as masking off the low bits.
+        mask_val = (0xFF << shift) & 0xFF
+        return cv2.bitwise_and(image, (mask_val,) * 4, dst=self._out(image.shape, image.dtype))
@@ -1,7 +1,23 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 from styles.base import Style
 
+_SHARPEN_BASE = np.ascontiguousarray([
+    [0, -1, 0],
+    [-1, 5, -1],
+    [0, -1, 0]
+], dtype=np.float32)
+
+
+@lru_cache(maxsize=64)
+def _sharpen_kernel(strength):
+    """float32 sharpen kernel with strength added to the centre tap (read-only)."""
+    kernel = _SHARPEN_BASE.copy()
+    kernel[1, 1] += strength
+    kernel.setflags(write=False)
+    return kernel
+
 class Sharpen(Style):
     name = "Sharpen"
     category = "Adjustments"
@@ -17,10 +33,6 @@ class Sharpen(Style):
 
         kernel_size = params["kernel_size"]
         strength = params["strength"]
-        kernel = np.array([
-            [0, -1, 0],
-            [-1, 5 + strength, -1],
-            [0, -1, 0]
-        ])
-        sharpened = cv2.filter2D(image, -1, kernel)
+        kernel = _sharpen_kernel(strength)
+        sharpened = cv2.filter2D(image, -1, kernel, dst=self._out(image.shape))
         return sharpened
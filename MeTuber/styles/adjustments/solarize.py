@@ -1,3 +1,4 @@
+import cv2
 import numpy as np
 from styles.base import Style
 
@@ -9,6 +10,9 @@ class Solarize(Style):
     name = "Solarize"
     category = "Adjustments"
 
+    # 256-entry tables keyed by threshold, shared across instances.
+    _lut_cache = {}
+
     def define_parameters(self):
         """
         Define parameters for the Solarize style.
@@ -54,7 +58,17 @@ class Solarize(Style):
         params = self.validate_params(params or {})
         threshold = params["threshold"]
 
-        # Apply the solarize effect
-        solarized = np.where(image < threshold, image, 255 - image)
+        return cv2.LUT(image, self._table(threshold), dst=self._out(image.shape))
 
-        return solarized.astype(np.uint8)
+    @classmethod
+    def _table(cls, threshold):
+        """
+        The solarize lookup: values at or above the threshold are inverted,
+        everything below passes through.
+        """
+        table = cls._lut_cache.get(threshold)
+        if table is None:
+            table = np.arange(256, dtype=np.uint8)
+            table[threshold:] = 255 - table[threshold:]
+            cls._lut_cache[threshold] = table
+        return table
@@ -28,12 +28,13 @@ class Threshold(Style):
             }
         ]
 
-    def apply(self, image, params=None):
+    def apply(self, image, params=None, ctx=None):
         """
         Apply a binary threshold to the input image.
 
         :param image: Input image (grayscale or BGR) as a NumPy array.
         :param params: Dictionary of parameters.
+        :param ctx: Optional FrameContext for the same image.
         :return: Thresholded image.
         :raises ValueError: If the input image is invalid.
         """
@@ -52,7 +53,7 @@ class Threshold(Style):
 
         # Convert color image to grayscale
         if len(image.shape) == 3 and image.shape[2] == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = self._gray(image, ctx)
         else:
             gray = image
 
@@ -1,5 +1,4 @@
 import cv2
-import numpy as np
 from styles.base import Style
 
 class Vibrance(Style):
@@ -10,6 +9,7 @@ class Vibrance(Style):
             "name": "vibrance",
             "type": "float",
             "default": 1.0,
+            "identity": 1.0,
             "min": 0.0,
             "max": 3.0,
             "step": 0.1,
@@ -21,15 +21,17 @@ class Vibrance(Style):
         if params is None:
             params = {}
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
         vibrance = params["vibrance"]
         # Convert grayscale to BGR to ensure 3 channels
         if len(image.shape) == 2:
             image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
 
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.float32)
-        hsv[:, :, 1] *= vibrance
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1], 0, 255)
-        hsv = hsv.astype(np.uint8)
-        vibrant = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+        # Scale only the S channel; convertScaleAbs multiplies and saturates
+        # to uint8 in one pass, so no float32 copy of the HSV image is needed.
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        hsv[:, :, 1] = cv2.convertScaleAbs(hsv[:, :, 1], alpha=vibrance)
+        vibrant = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=self._out(image.shape))
         return vibrant
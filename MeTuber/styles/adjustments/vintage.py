@@ -2,6 +2,14 @@ import cv2
 import numpy as np
 from styles.base import Style
 
+# float32 sepia matrix, built once at import time.
+_SEPIA_F32 = np.ascontiguousarray(
+    [[0.272, 0.534, 0.131],
+     [0.349, 0.686, 0.168],
+     [0.393, 0.769, 0.189]],
+    dtype=np.float32,
+)
+
 
 class Vintage(Style):
     name = "Vintage"
@@ -24,11 +32,8 @@ class Vintage(Style):
         params = self.validate_params(params)
 
         strength = params["vintage_strength"]
-        sepia_filter = np.array([[0.272, 0.534, 0.131],
-                                 [0.349, 0.686, 0.168],
-                                 [0.393, 0.769, 0.189]])
-        sepia = cv2.transform(image, sepia_filter)
-        sepia = np.clip(sepia, 0, 255).astype(np.uint8)
+        # cv2.transform saturates uint8 input, so no clip/cast pass is needed.
+        sepia = cv2.transform(image, _SEPIA_F32)
 
-        vintage = cv2.addWeighted(image, 1 - strength, sepia, strength, 0)
+        vintage = cv2.addWeighted(image, 1 - strength, sepia, strength, 0, dst=self._out(image.shape))
         return vintage
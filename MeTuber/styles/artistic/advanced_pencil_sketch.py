@@ -270,9 +270,8 @@ class PencilSketchwithColor(Style):
         The result is BGR but mostly grayscale lines.
         """
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        inv_gray = 255 - gray
-        blur = cv2.GaussianBlur(inv_gray, (21, 21), 0)
-        inv_blur = 255 - blur
-        sketch = cv2.divide(gray, inv_blur, scale=256.0)
+        # Color dodge: 255 - blur(255 - gray) reduces to blur(gray).
+        blur = cv2.GaussianBlur(gray, (21, 21), 0)
+        sketch = cv2.divide(gray, blur, scale=256.0)
         return cv2.cvtColor(sketch, cv2.COLOR_GRAY2BGR)
 
@@ -34,11 +34,12 @@ class EdgeDetection(Style):
         """
         return self.parameters
 
-    def apply(self, image, params=None):
+    def apply(self, image, params=None, ctx=None):
         """
         Apply the edge detection style using the validated parameters.
         :param image: Input BGR image.
         :param params: Dictionary of parameters.
+        :param ctx: Optional FrameContext for the same image.
         :return: Processed image with edges highlighted.
         """
         if image is None:
@@ -54,7 +55,7 @@ class EdgeDetection(Style):
         threshold2 = params["threshold2"]
 
         # Convert image to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self._gray(image, ctx)
 
         # Apply Canny edge detection
         edges = cv2.Canny(gray, threshold1, threshold2)
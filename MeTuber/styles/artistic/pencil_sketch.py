@@ -1,12 +1,15 @@
 import cv2
 import numpy as np
-from styles.base import Style
+from styles.base import BOX_BLUR_MIN_KSIZE, Style, box_blur_3x
 
 
 class PencilSketch(Style):
     """
     A style that creates a pencil sketch effect on live webcam feeds.
     """
+    # Use the box-blur approximation for large kernels
+    fast = True
+
     def __init__(self):
         super().__init__()
         self.name = "Pencil Sketch"
@@ -19,7 +22,7 @@ class PencilSketch(Style):
             "contrast": {"default": 1.5, "min": 0.5, "max": 5.0}
         }
 
-    def apply(self, image, params=None):
+    def apply(self, image, params=None, ctx=None):
         """Apply pencil sketch effect to the image.
         
         Args:
@@ -27,6 +30,7 @@ class PencilSketch(Style):
             params (dict, optional): Parameters for the effect
                 - blur_intensity: Intensity of the blur effect
                 - contrast: Contrast adjustment for the sketch
+            ctx (FrameContext, optional): Shared per-frame cache for the same image
         
         Returns:
             numpy.ndarray: Image with pencil sketch effect in grayscale format
@@ -48,10 +52,13 @@ class PencilSketch(Style):
             raise ValueError("Parameter 'contrast' must be between 0.5 and 5.0.")
 
         # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self._gray(image, ctx)
 
-        # Apply Gaussian blur
-        blurred = cv2.GaussianBlur(gray, (blur_intensity, blur_intensity), 0)
+        # Apply Gaussian blur (approximated by box blurs for large kernels)
+        if self.fast and blur_intensity > BOX_BLUR_MIN_KSIZE:
+            blurred = box_blur_3x(gray, blur_intensity)
+        else:
+            blurred = cv2.GaussianBlur(gray, (blur_intensity, blur_intensity), 0)
 
         # Apply adaptive threshold
         sketch = cv2.adaptiveThreshold(
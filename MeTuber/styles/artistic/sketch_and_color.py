@@ -70,17 +70,13 @@ class SketchAndColor(Style):
         # Convert image to grayscale
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
-        # Invert the grayscale image
-        inverted_gray = cv2.bitwise_not(gray)
-
-        # Apply Gaussian blur
-        blurred = cv2.GaussianBlur(inverted_gray, (blur_intensity, blur_intensity), 0)
-
-        # Invert the blurred image
-        inverted_blur = cv2.bitwise_not(blurred)
+        # Blur the grayscale image. The classic dodge inverts before and after
+        # the blur, but a normalized Gaussian commutes with inversion, so
+        # 255 - blur(255 - gray) == blur(gray) and both inverts can be skipped.
+        blurred = cv2.GaussianBlur(gray, (blur_intensity, blur_intensity), 0)
 
         # Create pencil sketch effect
-        sketch = cv2.divide(gray, inverted_blur, scale=256.0)
+        sketch = cv2.divide(gray, blurred, scale=256.0)
 
         # Blend the pencil sketch with the original image
         sketch_and_color = cv2.addWeighted(
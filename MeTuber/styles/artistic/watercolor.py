@@ -1,6 +1,6 @@
 import cv2
 import numpy as np
-from styles.base import Style  # Absolute import
+from styles.base import Style, parallel_bands  # Absolute import
 
 
 class Watercolor(Style):
@@ -65,7 +65,11 @@ class Watercolor(Style):
         sigma_s = params["sigma_s"]
         sigma_r = params["sigma_r"]
 
-        # Apply stylization using OpenCV's stylization function
-        watercolor = cv2.stylization(image, sigma_s=sigma_s, sigma_r=sigma_r)
+        # Apply stylization using OpenCV's stylization function. It runs on a
+        # single core, so split the frame into bands; its recursive filter
+        # settles within about sigma_s rows, which bounds the halo.
+        watercolor = parallel_bands(
+            image, lambda band: cv2.stylization(band, sigma_s=sigma_s, sigma_r=sigma_r), halo=sigma_s
+        )
 
         return watercolor
@@ -1,9 +1,172 @@
 # styles/base.py
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+import os
+import cv2
 import numpy as np
 
 
+class FrameContext:
+    """
+    Per-frame cache of derived images shared by styles applied to the same frame.
+
+    When several styles run on one frame (preview panes, A/B comparisons),
+    pass the same context to each so conversions such as BGR->GRAY run once.
+    Cached images are read-only.
+    """
+
+    def __init__(self, bgr: np.ndarray):
+        self.bgr = bgr
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+        gray.setflags(write=False)
+        return gray
+
+
+# Upper bound on entries in a style's lookup-table cache.
+LUT_CACHE_SIZE = 64
+
+
+def cache_lut(cache: Dict[Any, np.ndarray], key, build) -> np.ndarray:
+    """
+    Get ``cache[key]``, calling ``build()`` and storing the result on a miss.
+
+    The oldest entry is evicted first once the cache holds LUT_CACHE_SIZE
+    tables, so dragging a slider across its range cannot grow it unbounded.
+    """
+    table = cache.get(key)
+    if table is None:
+        if len(cache) >= LUT_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        table = cache[key] = build()
+    return table
+
+
+# Below this kernel size cv2.GaussianBlur is as fast as three box passes.
+BOX_BLUR_MIN_KSIZE = 21
+
+
+def box_blur_3x(src: np.ndarray, ksize: int, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Approximate ``cv2.GaussianBlur(src, (ksize, ksize), 0)`` with three box blurs.
+
+    Three uniform passes converge on a Gaussian, and ``cv2.blur`` uses running
+    sums, so the cost per pixel does not grow with the kernel size. The box
+    width is picked to match the sigma OpenCV derives from ``ksize``.
+    """
+    sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+    width = int(round(np.sqrt(4 * sigma * sigma + 1))) | 1
+    box = (width, width)
+    out = cv2.blur(src, box, dst=dst)
+    cv2.blur(out, box, dst=out)
+    return cv2.blur(out, box, dst=out)
+
+
+# Worker count for parallel_bands(); the pool is created on first use.
+BAND_WORKERS = os.cpu_count() or 1
+_band_executor: Optional[ThreadPoolExecutor] = None
+
+
+def parallel_bands(image: np.ndarray, fn, halo: int, bands: Optional[int] = None) -> np.ndarray:
+    """
+    Run ``fn`` on horizontal bands of ``image`` in parallel and stitch the results.
+
+    Each band is extended by ``halo`` rows on both sides so neighbourhood
+    filters see the same context as on the full frame; the halo is trimmed
+    before stitching. OpenCV releases the GIL, so the bands run concurrently.
+    Only use this for filters OpenCV does not already parallelize internally.
+    Single-core machines and frames too short to split call ``fn(image)``.
+
+    Args:
+        image (numpy.ndarray): Input image.
+        fn (callable): ``fn(band) -> band`` preserving the number of rows.
+        halo (int): Rows of overlap on each side of a band.
+        bands (int, optional): Number of bands. Defaults to BAND_WORKERS.
+
+    Returns:
+        numpy.ndarray: The stitched result, same number of rows as ``image``.
+    """
+    global _band_executor
+    bands = bands or BAND_WORKERS
+    height = image.shape[0]
+    # A band thinner than its halo spends more time on overlap than on output
+    if bands <= 1 or height < bands * max(halo, 1):
+        return fn(image)
+    if _band_executor is None:
+        _band_executor = ThreadPoolExecutor(max_workers=BAND_WORKERS, thread_name_prefix="style-band")
+
+    edges = np.linspace(0, height, bands + 1).astype(int)
+
+    def run(i):
+        y0, y1 = edges[i], edges[i + 1]
+        top, bottom = max(0, y0 - halo), min(height, y1 + halo)
+        return fn(image[top:bottom])[y0 - top:y1 - top]
+
+    results = list(_band_executor.map(run, range(bands)))
+    out = np.empty((height,) + results[0].shape[1:], dtype=results[0].dtype)
+    for i, band in enumerate(results):
+        out[edges[i]:edges[i + 1]] = band
+    return out
+
+
+def _cuda_device_count() -> int:
+    """Number of CUDA devices OpenCV can use (0 for CPU-only builds)."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount()
+    except (AttributeError, cv2.error):
+        return 0
+
+
+CUDA_AVAILABLE = _cuda_device_count() > 0
+
+# OpenCV's transparent API (cv2.UMat) only offloads when OpenCL is present.
+OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+
+
+class BoundParams(dict):
+    """
+    Read-only parameters already validated for one style and variant.
+
+    Produced by ``Style.bind``. ``validate_params`` returns them unchanged, so
+    the per-frame ``apply`` call skips the defaults/clamping loop entirely.
+    """
+
+    def __init__(self, params: Dict[str, Any], style: "Style", variant: Optional[str]):
+        super().__init__(params)
+        self.style = style
+        self.variant = variant
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Bound style parameters are read-only; bind new ones instead.")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+class CudaStyle:
+    """
+    Mixin for styles with an optional ``cv2.cuda`` code path.
+
+    ``use_cuda`` is only true on OpenCV builds with a CUDA device. Styles keep
+    their CPU implementation as the fallback. Set ``use_cuda = False`` on an
+    instance to force the CPU path.
+    """
+
+    use_cuda = CUDA_AVAILABLE
+
+    def _upload(self, image: np.ndarray):
+        """Upload a frame into a GpuMat that is reused across frames."""
+        gpu = self.__dict__.get("_gpu_frame")
+        if gpu is None:
+            gpu = self._gpu_frame = cv2.cuda_GpuMat()
+        gpu.upload(image)
+        return gpu
+
+
 class Style(ABC):
     """
     Abstract base class for all styles with variant/mode support.
@@ -12,6 +175,16 @@ class Style(ABC):
     category = "Base"
     variants = []  # List of available variants/modes
     default_variant = None  # Default variant to use
+    # Run apply() on a cv2.UMat so OpenCV can dispatch to OpenCL. Only enable
+    # on styles whose apply() uses nothing but cv2 calls on the image.
+    use_umat = False
+    # Every subclass ever defined, keyed by "module.QualifiedName" in
+    # definition order; load_styles() reads this instead of scanning modules.
+    _registry: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Style._registry[f"{cls.__module__}.{cls.__qualname__}"] = cls
 
     def __init__(self):
         # Initialize and normalize parameter definitions
@@ -51,6 +224,25 @@ class Style(ABC):
         # Current variant tracking
         self.current_variant = self.default_variant
 
+    @cached_property
+    def default_params(self) -> Dict[str, Any]:
+        """
+        Each parameter's declared default, computed once per instance.
+
+        Shared between callers, so copy it before modifying.
+        """
+        return {param["name"]: param.get("default", 0) for param in self.parameters}
+
+    @cached_property
+    def file_parameters(self) -> Tuple[Dict[str, Any], ...]:
+        """The parameter definitions of type ``"file"``, computed once per instance."""
+        return tuple(param for param in self.parameters if param.get("type") == "file")
+
+    @cached_property
+    def _identity_values(self) -> Tuple[Tuple[str, Any], ...]:
+        """``(name, identity)`` for every parameter declaring an identity value."""
+        return tuple((p["name"], p["identity"]) for p in self.parameters if "identity" in p)
+
     @abstractmethod
     def define_parameters(self) -> List[Dict[str, Any]]:
         """
@@ -162,6 +354,94 @@ class Style(ABC):
         # Default behavior is to return the original frame (no-op)
         return frame
 
+    def _out(self, shape, dtype=np.uint8) -> np.ndarray:
+        """
+        Get a reusable output buffer for the given shape and dtype.
+
+        Pass it as ``dst=`` to OpenCV calls so every frame writes into the same
+        memory instead of allocating a fresh array. The buffer is overwritten by
+        the next frame of the same shape, so copy any result you keep.
+
+        Args:
+            shape (tuple): Shape of the buffer.
+            dtype: NumPy dtype of the buffer.
+
+        Returns:
+            numpy.ndarray: An uninitialized array owned by this style instance.
+        """
+        # Subclasses do not always call super().__init__(), so create lazily.
+        buffers = self.__dict__.setdefault("_buffers", {})
+        key = (tuple(shape), np.dtype(dtype))
+        buf = buffers.get(key)
+        if buf is None:
+            buf = buffers[key] = np.empty(shape, dtype)
+        return buf
+
+    def _gray(self, image: np.ndarray, ctx: Optional[FrameContext] = None) -> np.ndarray:
+        """
+        Get the grayscale version of a BGR image, reusing ``ctx.gray`` when the
+        context belongs to this image.
+        """
+        if ctx is not None and ctx.bgr is image:
+            return ctx.gray
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    def process(self, frame: np.ndarray, params: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Apply the style to a NumPy frame, keeping it on the OpenCL device for
+        the whole of apply() when ``use_umat`` is set and OpenCL is available.
+
+        Args:
+            frame (numpy.ndarray): The input video frame.
+            params (dict): Parameters for the style.
+
+        Returns:
+            numpy.ndarray: The styled video frame.
+        """
+        if self.use_umat and OPENCL_AVAILABLE:
+            result = self.apply(cv2.UMat(frame), params)
+            return result.get() if isinstance(result, cv2.UMat) else result
+        return self.apply(frame, params)
+
+    def bind(self, params: Optional[Dict[str, Any]] = None):
+        """
+        Validate ``params`` once and return a ``processor(frame)`` using them.
+
+        Call this when parameters change rather than per frame: the returned
+        callable passes pre-validated, read-only parameters to ``apply``, so
+        the per-frame ``validate_params`` call is a single identity check.
+
+        Args:
+            params (dict, optional): Parameters for the style.
+
+        Returns:
+            Callable[[numpy.ndarray], numpy.ndarray]: The bound processor.
+        """
+        bound = BoundParams(self.validate_params(params or {}), self, self.current_variant)
+        return partial(self.apply, params=bound)
+
+    def is_identity(self, params: Dict[str, Any]) -> bool:
+        """
+        Whether the validated ``params`` leave every frame unchanged.
+
+        ``apply`` can then hand back the input untouched and pipelines can
+        drop the style from the chain altogether. By default a style is at
+        identity when every parameter declaring an ``"identity"`` value is set
+        to it; styles with no such parameter never are. Override for anything
+        the metadata cannot express.
+        """
+        identities = self._identity_values
+        if not identities:
+            return False
+        for name, identity in identities:
+            value = params.get(name)
+            if isinstance(identity, float):
+                if value is None or abs(value - identity) > 1e-6:
+                    return False
+            elif value != identity:
+                return False
+        return True
+
     def validate_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and set default values for parameters.
@@ -172,6 +452,9 @@ class Style(ABC):
         Returns:
             dict: Validated parameters with defaults applied.
         """
+        if isinstance(params, BoundParams) and params.style is self and params.variant == self.current_variant:
+            return params
+
         validated = {}
         
         # Get all parameters including variant-specific ones
@@ -226,3 +509,47 @@ class Style(ABC):
             "parameters": self.get_variant_parameters(self.current_variant),
             "description": self.describe()
         }
+
+
+class PointwiseStyle(Style):
+    """
+    Base class for styles that map every uint8 value independently
+    (brightness, contrast, gamma, ...).
+
+    Subclasses implement ``lut(params)``. Adjacent pointwise styles can then be
+    collapsed with ``compose_luts`` into one table and applied in a single
+    ``cv2.LUT`` pass instead of one full-image pass per style.
+    """
+
+    # Identity table, composed onto by compose_luts().
+    _IDENTITY_LUT = np.arange(256, dtype=np.uint8)
+
+    @abstractmethod
+    def lut(self, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Get the 256-entry uint8 lookup table for validated parameters.
+        Must be implemented by subclasses.
+        """
+
+    def apply_lut(self, image: np.ndarray, table: np.ndarray) -> np.ndarray:
+        """Apply a lookup table into this style's pooled output buffer."""
+        return cv2.LUT(image, table, dst=self._out(image.shape))
+
+    @staticmethod
+    def compose_luts(steps) -> np.ndarray:
+        """
+        Compose the tables of several pointwise styles, applied in order.
+
+        Args:
+            steps: Iterable of ``(style, params)`` pairs.
+
+        Returns:
+            numpy.ndarray: A single table equivalent to running the styles one
+            after another.
+        """
+        table = PointwiseStyle._IDENTITY_LUT
+        for style, params in steps:
+            params = style.validate_params(params or {})
+            if not style.is_identity(params):
+                table = style.lut(params)[table]
+        return table
@@ -2,7 +2,7 @@
 
 import cv2
 import numpy as np
-from ..base import Style
+from ..base import Style, cache_lut
 
 
 class BrightnessOnly(Style):
@@ -17,6 +17,7 @@ class BrightnessOnly(Style):
             "name": "brightness",
             "type": "int",
             "default": 0,
+            "identity": 0,
             "min": -100,
             "max": 100,
             "step": 1,
@@ -30,6 +31,21 @@ class BrightnessOnly(Style):
         """
         return self.parameters
 
+    # (1, 256, 3) HSV tables keyed by brightness, shared across instances.
+    _lut_cache = {}
+
+    @staticmethod
+    def _brightness_lut(brightness):
+        """
+        Builds the HSV table that shifts only the V channel by brightness.
+        """
+        levels = np.arange(256, dtype=np.int16)
+        table = np.empty((1, 256, 3), dtype=np.uint8)
+        table[0, :, 0] = levels
+        table[0, :, 1] = levels
+        table[0, :, 2] = np.clip(levels + brightness, 0, 255)
+        return table
+
     def apply(self, image, params=None):
         """
         Adjusts the brightness of the image.
@@ -52,17 +68,20 @@ class BrightnessOnly(Style):
 
         # Validate and sanitize parameters
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
         brightness = params["brightness"]
 
         # Convert to HSV for brightness adjustment
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        h, s, v = cv2.split(hsv)
 
-        # Apply brightness adjustment with clamping
-        v = np.clip(v.astype(int) + brightness, 0, 255).astype(np.uint8)
+        # Shift V with clamping through a per-channel LUT (H and S pass
+        # through), which avoids the split/int upcast/merge round trip
+        table = cache_lut(self._lut_cache, brightness, lambda: self._brightness_lut(brightness))
+        cv2.LUT(hsv, table, dst=hsv)
 
-        # Merge adjusted channels and convert back to BGR
-        adjusted = cv2.cvtColor(cv2.merge((h, s, v)), cv2.COLOR_HSV2BGR)
+        # Convert back to BGR
+        adjusted = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
 
         return adjusted
@@ -2,7 +2,7 @@
 
 import cv2
 import numpy as np
-from ..base import Style
+from ..base import Style, cache_lut
 
 
 class ColorBalance(Style):
@@ -17,6 +17,7 @@ class ColorBalance(Style):
             "name": "blue_shift",
             "type": "int",
             "default": 0,
+            "identity": 0,
             "min": -50,
             "max": 50,
             "step": 1,
@@ -26,6 +27,7 @@ class ColorBalance(Style):
             "name": "green_shift",
             "type": "int",
             "default": 0,
+            "identity": 0,
             "min": -50,
             "max": 50,
             "step": 1,
@@ -35,6 +37,7 @@ class ColorBalance(Style):
             "name": "red_shift",
             "type": "int",
             "default": 0,
+            "identity": 0,
             "min": -50,
             "max": 50,
             "step": 1,
@@ -48,6 +51,17 @@ class ColorBalance(Style):
         """
         return self.parameters
 
+    # (1, 256, 3) tables keyed by (blue, green, red) shift, shared across instances.
+    _lut_cache = {}
+
+    @staticmethod
+    def _balance_lut(shifts):
+        """
+        Builds the per-channel table (B, G, R columns) with the clipped shifts.
+        """
+        levels = np.arange(256, dtype=np.int16)[:, None]
+        return np.clip(levels + np.array(shifts, dtype=np.int16), 0, 255).astype(np.uint8).reshape(1, 256, 3)
+
     def apply(self, image, params=None):
         """
         Adjusts the color balance of the image.
@@ -70,20 +84,13 @@ class ColorBalance(Style):
 
         # Validate and sanitize parameters
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
-        blue_shift = params["blue_shift"]
-        green_shift = params["green_shift"]
-        red_shift = params["red_shift"]
-
-        # Split the channels
-        blue, green, red = cv2.split(image)
-
-        # Adjust each channel with clipping
-        blue = np.clip(blue.astype(int) + blue_shift, 0, 255).astype(np.uint8)
-        green = np.clip(green.astype(int) + green_shift, 0, 255).astype(np.uint8)
-        red = np.clip(red.astype(int) + red_shift, 0, 255).astype(np.uint8)
+        shifts = (params["blue_shift"], params["green_shift"], params["red_shift"])
+        table = cache_lut(self._lut_cache, shifts, lambda: self._balance_lut(shifts))
 
-        # Merge channels back
-        adjusted = cv2.merge((blue, green, red))
+        # One LUT pass on the interleaved image instead of split/adjust/merge
+        adjusted = cv2.LUT(image, table, dst=self._out(image.shape))
 
         return adjusted
@@ -1,10 +1,10 @@
 # File: styles/basic/contrast_only.py
 
 import cv2
-from ..base import Style
+from ..base import PointwiseStyle, cache_lut
 
 
-class ContrastOnly(Style):
+class ContrastOnly(PointwiseStyle):
     """
     Adjusts the contrast of the image.
     """
@@ -16,6 +16,7 @@ class ContrastOnly(Style):
             "name": "contrast",
             "type": "float",
             "default": 1.0,
+            "identity": 1.0,
             "min": 0.5,
             "max": 3.0,
             "step": 0.1,
@@ -29,6 +30,20 @@ class ContrastOnly(Style):
         """
         return self.parameters
 
+    # LUTs keyed by contrast, shared across instances.
+    _lut_cache = {}
+
+    def lut(self, params):
+        """
+        Returns the lookup table for a contrast factor.
+        """
+        contrast = params["contrast"]
+        # alpha is the contrast factor, beta=0 means no change in brightness
+        return cache_lut(
+            self._lut_cache, contrast,
+            lambda: cv2.convertScaleAbs(self._IDENTITY_LUT, alpha=contrast, beta=0).ravel()
+        )
+
     def apply(self, image, params=None):
         """
         Adjusts the contrast of the image by scaling the alpha value.
@@ -51,12 +66,10 @@ class ContrastOnly(Style):
 
         # Validate and sanitize parameters
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
 
-        contrast = params["contrast"]
-
-        # Apply contrast adjustment
-        # alpha is the contrast factor
-        # beta=0 means no change in brightness
-        adjusted = cv2.convertScaleAbs(image, alpha=contrast, beta=0)
+        # Apply contrast adjustment through the cached lookup table
+        adjusted = self.apply_lut(image, self.lut(params))
 
         return adjusted
@@ -1,6 +1,6 @@
 import cv2
 import numpy as np
-from ..base import Style
+from ..base import Style, cache_lut
 
 
 class VibrantColor(Style):
@@ -15,19 +15,41 @@ class VibrantColor(Style):
             "name": "intensity",
             "type": "float",
             "default": 1.5,
+            "identity": 1.0,
             "min": 0.5,
             "max": 3.0,
             "step": 0.1,
             "label": "Intensity",
-        }
+        },
+        {
+            "name": "exact_hsv",
+            "type": "bool",
+            "default": False,
+            "label": "Exact HSV Saturation",
+        },
     ]
 
+    # (1, 256, 3) HSV tables keyed by intensity, shared across instances.
+    _lut_cache = {}
+
     def define_parameters(self):
         """
         Returns the parameter definitions for color vibrancy.
         """
         return self.parameters
 
+    @staticmethod
+    def _saturation_lut(intensity):
+        """
+        Builds the HSV table that scales only the S channel by intensity.
+        """
+        levels = np.arange(256, dtype=np.float32)
+        table = np.empty((1, 256, 3), dtype=np.uint8)
+        table[0, :, 0] = levels
+        table[0, :, 1] = np.clip(levels * np.float32(intensity), 0, 255)
+        table[0, :, 2] = levels
+        return table
+
     def apply(self, image, params=None):
         """
         Enhances the vibrancy of colors in the image.
@@ -60,15 +82,20 @@ class VibrantColor(Style):
         # Validate and sanitize parameters
         params = self.validate_params(params)
         intensity = params["intensity"]
-
-        # Convert to HSV color space
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.float32)
-
-        # Enhance the saturation channel
-        hsv[:, :, 1] *= intensity
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1], 0, 255)  # Clamp saturation to valid range
-
-        # Convert back to BGR color space
-        vibrant_image = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
-
-        return vibrant_image
+        if self.is_identity(params):
+            return image
+
+        dst = self._out(image.shape)
+
+        if params["exact_hsv"]:
+            # Reference path: scale the S channel in HSV space. The table
+            # reproduces the float multiply-clip-truncate exactly in uint8.
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+            table = cache_lut(self._lut_cache, intensity, lambda: self._saturation_lut(intensity))
+            cv2.LUT(hsv, table, dst=hsv)
+            return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=dst)
+
+        # Push each pixel away from its luma: gray + intensity * (image - gray),
+        # computed in uint8 with saturation in a single addWeighted pass.
+        gray = cv2.cvtColor(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR)
+        return cv2.addWeighted(image, intensity, gray, 1.0 - intensity, 0, dst=dst)
@@ -7,20 +7,23 @@ from .base import Style
 class BitwiseOperation(Style, abc.ABC):
     """
     Abstract base class for all bitwise operations.
-    Provides common functionality for generating masks and validating images.
+    Provides common functionality for building the operand and validating images.
     """
     category = "Bitwise Operations"
 
-    def generate_mask(self, image, intensity):
+    def operand(self, image, intensity):
         """
-        Generates a mask with the given intensity.
+        Builds the scalar operand the image is combined with.
+
+        OpenCV broadcasts a scalar across every pixel, so no image-sized
+        mask has to be allocated per frame.
 
         Args:
             image (numpy.ndarray): Input image.
-            intensity (int): Intensity level for the mask.
+            intensity (int): Value (0-255) applied to every channel.
 
         Returns:
-            numpy.ndarray: A binary mask with the same shape as the input image.
+            tuple: A 4-element scalar accepted by the cv2 bitwise functions.
 
         Raises:
             ValueError: If the input image is invalid.
@@ -28,10 +31,7 @@ class BitwiseOperation(Style, abc.ABC):
         if image is None or not isinstance(image, np.ndarray):
             raise ValueError("Invalid image provided. Expected a NumPy array.")
 
-        # Generate a random mask based on intensity
-        mask = np.random.randint(0, 256, size=image.shape[:2], dtype=np.uint8)
-        mask = cv2.threshold(mask, intensity, 255, cv2.THRESH_BINARY)[1]
-        return mask
+        return (intensity,) * 4
 
     @abc.abstractmethod
     def define_parameters(self):
@@ -74,8 +74,7 @@ class BitwiseAnd(BitwiseOperation):
         """
         params = self.validate_params(params or {})
         intensity = params["mask_intensity"]
-        mask = self.generate_mask(image, intensity)
-        return cv2.bitwise_and(image, image, mask=mask)
+        return cv2.bitwise_and(image, self.operand(image, intensity))
 
 
 class BitwiseOr(BitwiseOperation):
@@ -110,8 +109,7 @@ class BitwiseOr(BitwiseOperation):
         """
         params = self.validate_params(params or {})
         intensity = params["mask_intensity"]
-        mask = self.generate_mask(image, intensity)
-        return cv2.bitwise_or(image, image, mask=mask)
+        return cv2.bitwise_or(image, self.operand(image, intensity))
 
 
 class BitwiseXor(BitwiseOperation):
@@ -146,5 +144,4 @@ class BitwiseXor(BitwiseOperation):
         """
         params = self.validate_params(params or {})
         intensity = params["mask_intensity"]
-        mask = self.generate_mask(image, intensity)
-        return cv2.bitwise_xor(image, image, mask=mask)
+        return cv2.bitwise_xor(image, self.operand(image, intensity))
@@ -73,12 +73,14 @@ class AdvancedHalftone(Style):
         # Apply binary thresholding
         _, binary = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
 
-        # Create an empty white canvas
-        halftone = np.full_like(image, 255)
+        # Create an empty white canvas. Dots are black, so all three channels
+        # would be identical: draw on one and expand to BGR once at the end.
+        halftone = np.full_like(gray, 255)
 
         # Optimized halftone pattern drawing
-        y_indices, x_indices = np.where(binary == 0)  # Find black pixels
-        for y, x in zip(y_indices[::dot_size * 2], x_indices[::dot_size * 2]):
-            cv2.circle(halftone, (x, y), dot_size, (0, 0, 0), -1)
+        y_indices, x_indices = np.nonzero(binary == 0)  # Find black pixels
+        step = dot_size * 2
+        for y, x in zip(y_indices[::step].tolist(), x_indices[::step].tolist()):
+            cv2.circle(halftone, (x, y), dot_size, 0, -1)
 
-        return halftone
+        return cv2.cvtColor(halftone, cv2.COLOR_GRAY2BGR, dst=self._out(image.shape))
@@ -41,12 +41,21 @@ class Glitch(Style):
         num_shifts = params["num_shifts"]
         h, w = image.shape[:2]
 
-        glitched_image = image.copy()
+        glitched_image = self._out(image.shape)
+        np.copyto(glitched_image, image)
 
-        # Apply random shifts to color channels
-        for _ in range(num_shifts):
-            channel = np.random.randint(0, 3)
-            shift = np.random.randint(-max_shift, max_shift + 1)
+        # Sample every (channel, shift) pair in one call each. Every shift is
+        # taken from the original image and overwrites the whole channel, so
+        # only the last non-zero shift per channel is visible: apply just
+        # those (at most three slice copies instead of num_shifts).
+        channels = np.random.randint(0, 3, size=num_shifts)
+        shifts = np.random.randint(-max_shift, max_shift + 1, size=num_shifts)
+        nonzero = np.flatnonzero(shifts)
+        last = np.full(3, -1)
+        np.maximum.at(last, channels[nonzero], nonzero)
+        final_shift = {channel: int(shifts[i]) for channel, i in enumerate(last.tolist()) if i >= 0}
+
+        for channel, shift in final_shift.items():
             if shift > 0:
                 glitched_image[:, :w - shift, channel] = image[:, shift:, channel]
                 glitched_image[:, w - shift:, channel] = 0
@@ -55,28 +55,28 @@ class Halftone(Style):
         if not 0 <= threshold <= 255:
             raise ValueError("Parameter 'threshold' must be between 0 and 255.")
 
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        # Create output image
-        output = np.zeros_like(image)
-
-        # Process each color channel separately
-        for c in range(3):
-            # Get current channel
-            channel = image[:, :, c]
-            
-            # Create halftone pattern for this channel
-            for y in range(0, gray.shape[0], dot_size):
-                for x in range(0, gray.shape[1], dot_size):
-                    # Get the average intensity in this region
-                    region = channel[y:y+dot_size, x:x+dot_size]
-                    avg_intensity = np.mean(region)
-                    
-                    # Create dot based on intensity
-                    if avg_intensity > threshold:
-                        output[y:y+dot_size, x:x+dot_size, c] = 255
-                    else:
-                        output[y:y+dot_size, x:x+dot_size, c] = 0
+        h, w = image.shape[:2]
+        rows, cols = -(-h // dot_size), -(-w // dot_size)
+
+        # Sum every dot_size x dot_size cell per channel in one reshape; the
+        # frame is zero-padded so edge cells just sum fewer pixels.
+        padded = cv2.copyMakeBorder(
+            image, 0, rows * dot_size - h, 0, cols * dot_size - w, cv2.BORDER_CONSTANT, value=0
+        )
+        cells = padded.reshape(rows, dot_size, cols, dot_size, -1).sum(axis=(1, 3), dtype=np.uint32)
+
+        # Pixels per cell (smaller along the bottom and right edges)
+        counts = (
+            np.minimum(dot_size, h - np.arange(rows) * dot_size)[:, None]
+            * np.minimum(dot_size, w - np.arange(cols) * dot_size)[None, :]
+        )
+
+        # mean > threshold  <=>  sum > threshold * count
+        dots = np.where(cells > (threshold * counts)[:, :, None], 255, 0).astype(np.uint8)
+
+        # Expand each cell back to a dot_size block in one nearest-neighbour
+        # resize (exact for an integer factor) and crop to the frame
+        output = cv2.resize(dots, None, fx=dot_size, fy=dot_size, interpolation=cv2.INTER_NEAREST)
+        output = np.ascontiguousarray(output[:h, :w].reshape(image.shape))
 
         return output
@@ -19,6 +19,7 @@ class LightLeak(Style):
                 "name": "leak_intensity",
                 "type": "int",
                 "default": 50,
+                "identity": 0,
                 "min": 0,
                 "max": 100,
                 "step": 5,
@@ -59,6 +60,8 @@ class LightLeak(Style):
 
         # Validate and sanitize parameters
         params = self.validate_params(params)
+        if self.is_identity(params):
+            return image
         intensity = params["leak_intensity"]
         color = params["leak_color"].lower()
         position = params["leak_position"].lower()
@@ -85,11 +88,48 @@ class LightLeak(Style):
         }
         center = position_dict.get(position, (w - radius, radius))
 
-        # Create an overlay for the light leak effect
-        overlay = image.copy()
-        cv2.circle(overlay, center, radius, leak_color, -1)
-
-        # Blend the overlay with the original image
-        output = cv2.addWeighted(image, 1 - intensity / 100, overlay, intensity / 100, 0)
+        # The overlay only differs from the frame inside the disk, and blending
+        # a pixel with itself leaves it unchanged, so only the disk's bounding
+        # box is blended; everything else is a straight copy.
+        (y0, y1, x0, x1), disk, mask = self._leak_overlay(image.shape, center, radius, leak_color)
+        alpha = intensity / 100
+        output = self._out(image.shape)
+        np.copyto(output, image)
+        if disk is not None:
+            blended = cv2.addWeighted(image[y0:y1, x0:x1], 1 - alpha, disk, alpha, 0)
+            np.copyto(output[y0:y1, x0:x1], blended, where=mask)
 
         return output
+
+    def _leak_overlay(self, shape, center, radius, leak_color):
+        """
+        Get the cached light leak disk for a frame shape, position and color.
+
+        Returns:
+            tuple: ``(y0, y1, x0, x1)`` bounding box of the disk, the disk
+            drawn on black at that size, and a boolean mask of the disk. The
+            last two are None when the disk misses the frame.
+        """
+        cache = self.__dict__.setdefault("_overlay_cache", {})
+        key = (shape, center, radius, leak_color)
+        overlay = cache.get(key)
+        if overlay is None:
+            h, w = shape[:2]
+            channels = shape[2:]
+            cx, cy = center
+            y0, y1 = max(cy - radius, 0), min(cy + radius + 1, h)
+            x0, x1 = max(cx - radius, 0), min(cx + radius + 1, w)
+            disk = mask = None
+            if y1 > y0 and x1 > x0:  # the disk can miss tiny frames entirely
+                local_center = (cx - x0, cy - y0)
+                # Draw the disk on black with the same call the full-frame
+                # overlay used, so the color maps onto any channel count alike
+                disk = np.zeros((y1 - y0, x1 - x0) + channels, dtype=np.uint8)
+                cv2.circle(disk, local_center, radius, leak_color, -1)
+                coverage = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+                cv2.circle(coverage, local_center, radius, 255, -1)
+                mask = (coverage > 0).reshape(coverage.shape + (1,) * len(channels))
+            if len(cache) >= 8:
+                cache.pop(next(iter(cache)))
+            overlay = cache[key] = ((y0, y1, x0, x1), disk, mask)
+        return overlay
@@ -55,13 +55,25 @@ class Mosaic(Style):
         if tile_size > min(h, w):
             raise ValueError(f"Tile size ({tile_size}) cannot exceed the smaller image dimension ({min(h, w)}).")
 
+        hs, ws = h // tile_size, w // tile_size
+
         # Resize down to create larger "tiles"
         mosaic_image = cv2.resize(
             image, 
-            (w // tile_size, h // tile_size), 
+            (ws, hs),
             interpolation=cv2.INTER_AREA
         )
 
+        if hs * tile_size == h and ws * tile_size == w:
+            # Tiles divide the frame exactly: repeat each pixel into its tile
+            # with a broadcast view instead of running the resize kernel.
+            channels = mosaic_image.shape[2:]
+            tiled = np.broadcast_to(
+                mosaic_image[:, None, :, None],
+                (hs, tile_size, ws, tile_size) + channels,
+            )
+            return np.ascontiguousarray(tiled).reshape((h, w) + channels)
+
         # Resize back up to original size to create the mosaic effect
         mosaic_image = cv2.resize(
             mosaic_image, 
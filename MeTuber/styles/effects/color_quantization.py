@@ -22,6 +22,17 @@ class ColorQuantization(Style):
         }
     ]
 
+    # Frames between k-means palette refreshes; in between, pixels are only
+    # assigned to the cached palette.
+    PALETTE_REFRESH_FRAMES = 30
+    # Every Nth pixel is sampled when fitting the palette.
+    SAMPLE_STRIDE = 16
+
+    def __init__(self):
+        super().__init__()
+        self._palette = None
+        self._frame_count = 0
+
     def define_parameters(self):
         """
         Define the parameters for the Color Quantization effect.
@@ -53,18 +64,40 @@ class ColorQuantization(Style):
         # Reshape the image to a 2D array of pixels and 3 color values (BGR)
         Z = image.reshape((-1, 3)).astype(np.float32)
 
-        # Define criteria, number of clusters (K) and apply kmeans()
-        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
-        attempts = 10
-        ret, labels, centers = cv2.kmeans(Z, clusters, None, criteria, attempts, cv2.KMEANS_RANDOM_CENTERS)
-
-        # Convert centers to uint8 (as required by OpenCV)
-        centers = np.uint8(centers)
+        if (
+            self._palette is None
+            or len(self._palette) != clusters
+            or self._frame_count % self.PALETTE_REFRESH_FRAMES == 0
+        ):
+            self._palette = self._fit_palette(Z, clusters)
+            self._frame_count = 0
+        self._frame_count += 1
 
-        # Map each pixel to the center value
-        res = centers[labels.flatten()]
+        # Nearest center per pixel: argmin of |c|^2 - 2 z.c (|z|^2 is constant per row)
+        centers = self._palette
+        distances = Z @ (-2.0 * centers.T)
+        distances += (centers * centers).sum(axis=1)
+        labels = distances.argmin(axis=1)
 
-        # Reshape back to the original image dimension
-        quantized = res.reshape((image.shape))
+        # Map each pixel to the center value and reshape back
+        quantized = np.uint8(centers)[labels].reshape(image.shape)
 
         return quantized
+
+    def _fit_palette(self, Z, clusters):
+        """
+        Fit a k-means palette on a subsample of the pixels.
+
+        Args:
+            Z (numpy.ndarray): float32 pixels, shape (N, 3).
+            clusters (int): Number of palette colors.
+
+        Returns:
+            numpy.ndarray: float32 cluster centers, shape (clusters, 3).
+        """
+        sample = Z[::self.SAMPLE_STRIDE]
+        if len(sample) < clusters:
+            sample = Z
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 5, 1.0)
+        _, _, centers = cv2.kmeans(sample, clusters, None, criteria, 1, cv2.KMEANS_PP_CENTERS)
+        return centers
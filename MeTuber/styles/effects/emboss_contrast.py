@@ -1,7 +1,27 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 from ..base import Style
 
+_EMBOSS_BASE = np.ascontiguousarray([
+    [-2, -1, 0],
+    [-1,  1, 1],
+    [0,   1, 2]
+], dtype=np.float32)
+
+
+@lru_cache(maxsize=64)
+def _emboss_contrast_lut(scale, contrast):
+    """
+    256-entry table equal to convertScaleAbs(alpha=scale, beta=128) followed
+    by convertScaleAbs(alpha=contrast) on the uint8 emboss (read-only).
+    """
+    table = np.arange(256, dtype=np.uint8)
+    table = cv2.convertScaleAbs(table, alpha=scale, beta=128)
+    table = cv2.convertScaleAbs(table, alpha=contrast, beta=0).ravel()
+    table.setflags(write=False)
+    return table
+
 
 class EmbossContrast(Style):
     """
@@ -72,21 +92,7 @@ class EmbossContrast(Style):
         scale = params["scale"]
         contrast = params["contrast"]
 
-        # Define the emboss kernel
-        emboss_kernel = np.array(
-            [[-2, -1, 0],
-             [-1, 1, 1],
-             [0, 1, 2]],
-            dtype=np.float32,
-        )
-
-        # Apply the emboss filter
-        embossed = cv2.filter2D(image, -1, emboss_kernel)
-
-        # Scale the embossed image
-        embossed = cv2.convertScaleAbs(embossed, alpha=scale, beta=128)
-
-        # Adjust contrast
-        contrasted = cv2.convertScaleAbs(embossed, alpha=contrast, beta=0)
-
-        return contrasted
+        # The emboss saturates to uint8, so both scaling passes collapse into
+        # one exact lookup applied in place on the pooled output buffer.
+        out = cv2.filter2D(image, cv2.CV_8U, _EMBOSS_BASE, dst=self._out(image.shape))
+        return cv2.LUT(out, _emboss_contrast_lut(scale, contrast), dst=out)
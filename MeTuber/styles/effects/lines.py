@@ -44,7 +44,7 @@ class HoughLines(Style):
             },
         ]
 
-    def apply(self, image, params=None):
+    def apply(self, image, params=None, ctx=None):
         """
         Detects lines in the image using the Probabilistic Hough Line Transform
         and draws them on the image.
@@ -60,16 +60,22 @@ class HoughLines(Style):
         minLineLength = params["minLineLength"]
         maxLineGap = params["maxLineGap"]
 
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self._gray(image, ctx)
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
-        lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold, minLineLength, maxLineGap)
-
+        lines = cv2.HoughLinesP(
+            edges, 1, np.pi / 180, threshold,
+            minLineLength=minLineLength, maxLineGap=maxLineGap
+        )
+
+        # Draw onto a copy so the caller's frame is left untouched
+        output = self._out(image.shape, image.dtype)
+        np.copyto(output, image)
         if lines is not None:
-            for line in lines:
-                x1, y1, x2, y2 = line[0]
-                cv2.line(image, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            # Each (x1, y1, x2, y2) row is a two-point open polyline; draw
+            # them all in one call instead of one cv2.line per segment.
+            cv2.polylines(output, lines.reshape(-1, 2, 2), isClosed=False, color=(0, 255, 0), thickness=2)
 
-        return image
+        return output
     
 class CannyEdge(Style):
     """
@@ -89,7 +95,7 @@ class CannyEdge(Style):
             {"name": "apertureSize", "type": "int", "default": 3, "min": 3, "max": 7, "step": 2, "label": "Aperture Size"},
         ]
 
-    def apply(self, image, params=None):
+    def apply(self, image, params=None, ctx=None):
         """
         Detects edges in the image using the Canny edge detection algorithm.
         """
@@ -106,7 +112,7 @@ class CannyEdge(Style):
         threshold1 = params["threshold1"]
         threshold2 = params["threshold2"]
 
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self._gray(image, ctx)
         edges = cv2.Canny(gray, threshold1, threshold2, apertureSize=apertureSize, L2gradient=True)
 
         return edges
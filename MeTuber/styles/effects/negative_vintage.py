@@ -1,7 +1,27 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 from ..base import Style
 
+# Sepia matrix shared by every frame instead of being rebuilt in apply().
+_SEPIA_F32 = np.ascontiguousarray(
+    [[0.272, 0.534, 0.131],
+     [0.349, 0.686, 0.168],
+     [0.393, 0.769, 0.189]],
+    dtype=np.float32,
+)
+
+
+@lru_cache(maxsize=32)
+def _negative_sepia_matrix(sepia_intensity):
+    """3x4 affine matrix applying invert, sepia and intensity in one transform (read-only)."""
+    scaled = _SEPIA_F32 * np.float32(sepia_intensity)
+    offset = scaled.sum(axis=1, keepdims=True) * 255.0
+    matrix = np.ascontiguousarray(np.hstack([-scaled, offset]), dtype=np.float32)
+    matrix.setflags(write=False)
+    return matrix
+
+
 class NegativeVintage(Style):
     """
     Applies a negative vintage effect to the image with adjustable sepia intensity.
@@ -49,21 +69,7 @@ class NegativeVintage(Style):
 
         sepia_intensity = params["sepia_intensity"]
 
-        # Step 1: Invert the image
-        inverted_image = cv2.bitwise_not(image)
-
-        # Step 2: Apply sepia filter
-        sepia_filter = np.array(
-            [[0.272, 0.534, 0.131],
-             [0.349, 0.686, 0.168],
-             [0.393, 0.769, 0.189]],
-            dtype=np.float32,
-        )
-
-        # Transform the inverted image using the sepia filter
-        sepia = cv2.transform(inverted_image, sepia_filter)
-
-        # Scale the sepia effect by the sepia intensity parameter
-        sepia = np.clip(sepia * sepia_intensity, 0, 255).astype(np.uint8)
-
-        return sepia
+        # Invert, sepia and intensity folded into one affine transform:
+        # s * M @ (255 - x) == (s * M @ 255) - s * M @ x
+        matrix = _negative_sepia_matrix(sepia_intensity)
+        return cv2.transform(image, matrix, dst=self._out(image.shape))
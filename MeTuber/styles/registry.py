@@ -0,0 +1,98 @@
+# styles/registry.py
+"""
+Specialized frame processors for cheap styles.
+
+``get_processor(style, params)`` validates the parameters once with the
+style's own ``validate_params`` and returns a closure that does nothing per
+frame but the OpenCV call itself, built from the style's own table or kernel
+helper. Factories are memoized on the style and its validated parameters, so
+moving a slider back to a previous value is free.
+
+Styles without an entry (or whose parameters fail validation) return ``None``
+and keep going through ``Style.apply``. Entries are keyed by the exact style
+class, so a subclass that changes ``apply`` never picks up its parent's
+processor.
+
+Processors return a new array (or their input) and never a pooled buffer, so
+callers may keep the result across frames without copying it.
+"""
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .adjustments.blur import BlurStyle
+from .adjustments.brightness_contrast import BrightnessContrast
+from .adjustments.gamma_correction import GammaCorrection
+from .adjustments.solarize import Solarize
+from .base import Style
+from .basic.contrast_only import ContrastOnly
+
+logger = logging.getLogger(__name__)
+
+Processor = Callable[[np.ndarray], np.ndarray]
+
+# style class -> factory(style, validated parameters as sorted items)
+STYLE_REGISTRY: Dict[type, Callable[[Style, Tuple[Tuple[str, Any], ...]], Processor]] = {}
+
+
+def _register(*style_classes):
+    def decorator(factory):
+        cached = lru_cache(maxsize=64)(factory)
+        for style_class in style_classes:
+            STYLE_REGISTRY[style_class] = cached
+        return factory
+    return decorator
+
+
+def get_processor(style: Style, params: Optional[Dict[str, Any]]) -> Optional[Processor]:
+    """
+    Get the specialized processor for a style instance and parameters.
+
+    Args:
+        style (Style): The style instance.
+        params (dict): The style parameters, validated here.
+
+    Returns:
+        Optional[Callable]: ``processor(image) -> image``, or None if the style
+        has no specialized version or its parameters cannot be used.
+    """
+    factory = STYLE_REGISTRY.get(type(style))
+    if factory is None:
+        return None
+    try:
+        validated = style.validate_params(params or {})
+        return factory(style, tuple(sorted(validated.items())))
+    except Exception as e:
+        # Unhashable or invalid parameters: let Style.apply handle them
+        logger.debug(f"No specialized processor for '{style.name}': {e}")
+        return None
+
+
+def _identity(image):
+    return image
+
+
+def _lut_processor(table):
+    return lambda image: cv2.LUT(image, table)
+
+
+@_register(ContrastOnly, BrightnessContrast, GammaCorrection)
+def _make_pointwise(style, items):
+    params = dict(items)
+    if style.is_identity(params):
+        return _identity
+    return _lut_processor(style.lut(params))
+
+
+@_register(Solarize)
+def _make_solarize(style, items):
+    return _lut_processor(style._table(dict(items)["threshold"]))
+
+
+@_register(BlurStyle)
+def _make_blur(style, items):
+    kernel_size = dict(items)["kernel_size"]
+    return lambda image: style._blur(image, kernel_size)
@@ -0,0 +1,123 @@
+# MeTuber\tests\conftest.py
+
+import importlib
+import os
+import tempfile
+import types
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+# Render Qt offscreen so CI never waits on an X11/Wayland handshake.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Keep the FFmpeg device cache and styles manifest out of the user's home directory.
+_CACHE_DIR = tempfile.mkdtemp(prefix="metuber-tests-")
+os.environ.setdefault("METUBER_DEVICES_CACHE", os.path.join(_CACHE_DIR, "devices.json"))
+os.environ.setdefault("METUBER_STYLES_MANIFEST", os.path.join(_CACHE_DIR, "styles.json"))
+
+from PyQt5.QtWidgets import QApplication
+
+# Module-level reference keeps the QApplication alive for the whole session
+# (otherwise it can be garbage collected between test modules).
+_app_ref = None
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create a single QApplication instance shared by every test module."""
+    global _app_ref
+    if _app_ref is None:
+        _app_ref = QApplication.instance() or QApplication([])
+    yield _app_ref
+    # Do not call quit() here as it will be handled by pytest-qt
+
+
+def _read_only_zeros(shape):
+    frame = np.zeros(shape, dtype=np.uint8)
+    frame.setflags(write=False)
+    return frame
+
+
+@pytest.fixture(scope="session")
+def zero_frame_hd():
+    """Shared read-only 640x480 BGR frame."""
+    return _read_only_zeros((480, 640, 3))
+
+
+@pytest.fixture(scope="session")
+def zero_frame_tiny():
+    """Shared read-only 10x10 BGR frame."""
+    return _read_only_zeros((10, 10, 3))
+
+
+# Stand-in for pkgutil inside webcam_filter_pyqt5: discovery finds no modules.
+_EMPTY_PKGUTIL = types.SimpleNamespace(walk_packages=lambda *args, **kwargs: [])
+
+
+_STYLE_MODULE_ATTRS = ["__path__", "Style", "Original", "AdvancedCartoon", "AdvancedCartoonAnime"]
+
+
+def _patch_module_attrs(monkeypatch, module, mapping):
+    """Patch several attributes of one module in a single pass."""
+    for name, value in mapping.items():
+        monkeypatch.setattr(module, name, value, raising=False)
+
+
+def _mock_style_imports(monkeypatch):
+    """Replace the style imports of webcam_filter_pyqt5 with mocks."""
+    # spec_set pins the attribute set up front, so a typo fails loudly instead
+    # of quietly synthesizing a fresh child mock.
+    mock_style = MagicMock(spec_set=_STYLE_MODULE_ATTRS)
+    mock_style.__path__ = []
+    _patch_module_attrs(monkeypatch, importlib.import_module("webcam_filter_pyqt5"), {
+        "Style": mock_style.Style,
+        "Original": mock_style.Original,
+        "AdvancedCartoon": mock_style.AdvancedCartoon,
+        "AdvancedCartoonAnime": mock_style.AdvancedCartoonAnime,
+        "pkgutil": _EMPTY_PKGUTIL,
+        "_STYLES_CACHE": None,
+    })
+    return mock_style
+
+
+@pytest.fixture
+def _style_mocks(monkeypatch):
+    """Mock all style-related imports of webcam_filter_pyqt5."""
+    return _mock_style_imports(monkeypatch)
+
+
+@pytest.fixture(scope="session")
+def _discovered_styles():
+    """Real style discovery, run once per session."""
+    from webcam_filter_pyqt5 import load_styles
+
+    return load_styles(refresh=True)
+
+
+@pytest.fixture
+def shared_styles(monkeypatch, _discovered_styles):
+    """
+    Seed load_styles()' process cache with a per-test copy of the session's
+    discovery, so apps start fast but tests that swap styles cannot leak.
+    """
+    import webcam_filter_pyqt5
+
+    instances, categories = _discovered_styles
+    copied = (
+        webcam_filter_pyqt5.LazyStyleDict(instances),
+        {category: list(names) for category, names in categories.items()},
+    )
+    monkeypatch.setattr(webcam_filter_pyqt5, "_STYLES_CACHE", copied)
+    return copied
+
+
+@pytest.fixture(scope="session")
+def loaded_styles_empty():
+    """Run load_styles() once per session with no style modules discoverable."""
+    from webcam_filter_pyqt5 import load_styles
+
+    with pytest.MonkeyPatch.context() as mp:
+        _mock_style_imports(mp)
+        style_instances, style_categories = load_styles()
+    return style_instances, style_categories
@@ -1,6 +1,5 @@
 import pytest
 import numpy as np
-from PyQt5.QtWidgets import QApplication
 from unittest.mock import MagicMock, patch
 from src.gui.main_window import MainWindow
 from src.config.settings_manager import SettingsManager
@@ -25,13 +24,6 @@ class MockStyle:
     def define_parameters(self):
         return self.parameters
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create a QApplication instance."""
-    app = QApplication([])
-    yield app
-    app.quit()
-
 @pytest.fixture
 def mock_managers():
     """Create mock manager instances."""
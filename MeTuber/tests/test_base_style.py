@@ -1,7 +1,7 @@
 # tests/test_base_style.py
 import pytest
 import numpy as np
-from styles.base import Style
+from styles.base import PointwiseStyle, Style
 import time
 
 class BaseStyleHelper(Style):
@@ -176,3 +176,81 @@ def test_describe():
     assert "- int_param: int" in description
     assert "- float_param: float" in description
     assert "- str_param: str" in description
+
+
+def test_default_params():
+    style = BaseStyleHelper()
+    assert style.default_params == {"int_param": 5, "float_param": 0.5, "str_param": "option1"}
+    assert style.default_params is style.default_params
+
+
+def test_subclasses_register_themselves():
+    key = f"{BaseStyleHelper.__module__}.BaseStyleHelper"
+    assert Style._registry[key] is BaseStyleHelper
+
+
+def test_out_buffer_reuse():
+    style = BaseStyleHelper()
+    buf = style._out((4, 5, 3))
+    assert buf.shape == (4, 5, 3) and buf.dtype == np.uint8
+    assert style._out((4, 5, 3)) is buf
+    assert style._out((4, 5)) is not buf
+    assert style._out((4, 5, 3), np.float32) is not buf
+
+
+def test_frame_context_gray_shared(dummy_image):
+    from styles.base import FrameContext
+
+    style = BaseStyleHelper()
+    ctx = FrameContext(dummy_image)
+    gray = style._gray(dummy_image, ctx)
+    assert gray.shape == dummy_image.shape[:2]
+    assert style._gray(dummy_image, ctx) is gray
+    # A context for a different frame is ignored
+    assert style._gray(dummy_image.copy(), ctx) is not gray
+
+
+def test_parallel_bands_matches_full_frame():
+    import cv2
+    from styles.base import parallel_bands
+
+    image = np.random.default_rng(0).integers(0, 256, (97, 64, 3), dtype=np.uint8)
+    blur = lambda band: cv2.GaussianBlur(band, (7, 7), 0)
+    # A halo of ksize // 2 rows gives every band the full-frame neighbourhood
+    result = parallel_bands(image, blur, halo=3, bands=4)
+    assert np.array_equal(result, blur(image))
+
+
+class PointwiseHelper(PointwiseStyle):
+    """Pointwise helper computing ``value * scale + offset``."""
+    name = "Test Pointwise"
+    category = "Test Category"
+    variants = ["Default"]
+
+    def define_parameters(self):
+        return [
+            {"name": "scale", "type": "float", "default": 1.0, "identity": 1.0, "min": 0.0, "max": 4.0, "step": 0.1},
+            {"name": "offset", "type": "int", "default": 0, "identity": 0, "min": -255, "max": 255, "step": 1},
+        ]
+
+    def lut(self, params):
+        values = np.arange(256, dtype=np.float32) * params["scale"] + params["offset"]
+        return np.clip(np.round(values), 0, 255).astype(np.uint8)
+
+    def apply(self, image, params=None):
+        params = self.validate_params(params or {})
+        if self.is_identity(params):
+            return image
+        return self.apply_lut(image, self.lut(params))
+
+
+def test_compose_luts_matches_sequential_apply():
+    import cv2
+
+    # Every uint8 value in every channel
+    image = np.repeat(np.arange(256, dtype=np.uint8).reshape(16, 16, 1), 3, axis=2)
+    first, second = PointwiseHelper(), PointwiseHelper()
+    pa, pb = {"scale": 1.7, "offset": -40}, {"scale": 0.6, "offset": 25}
+    table = PointwiseStyle.compose_luts([(first, pa), (second, pb)])
+    expected = second.apply(first.apply(image, pa), pb)
+    assert np.array_equal(cv2.LUT(image, table), expected)
@@ -37,7 +37,8 @@ def test_bitwise_or(dummy_image):
 
     assert isinstance(result, np.ndarray)
     assert result.shape == dummy_image.shape
-    assert not np.array_equal(result, dummy_image)
+    # OR-ing any value into a white image leaves it white
+    assert np.array_equal(result, dummy_image)
 
 
 def test_bitwise_xor(dummy_image):
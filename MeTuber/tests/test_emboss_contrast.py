@@ -0,0 +1,33 @@
+# MeTuber\tests\test_emboss_contrast.py
+
+import cv2
+import numpy as np
+import pytest
+
+from styles.base import Style
+from styles.effects.emboss_contrast import EmbossContrast
+
+
+@pytest.fixture(autouse=True)
+def _variantless_styles_validate(monkeypatch):
+    """Let styles without variants validate against their base parameters."""
+    monkeypatch.setattr(Style, "validate_variant", lambda self, variant: variant is None or variant in self.variants)
+
+
+def _baseline(image, scale, contrast):
+    """The original emboss -> scale -> contrast pipeline."""
+    kernel = np.array([[-2, -1, 0], [-1, 1, 1], [0, 1, 2]], dtype=np.float32)
+    embossed = cv2.filter2D(image, -1, kernel)
+    embossed = cv2.convertScaleAbs(embossed, alpha=scale, beta=128)
+    return cv2.convertScaleAbs(embossed, alpha=contrast, beta=0)
+
+
+@pytest.mark.parametrize("scale, contrast", [(1.0, 1.0), (0.5, 2.0), (3.0, 0.5), (1.3, 0.7), (2.0, 3.0)])
+def test_apply_matches_baseline_pipeline(scale, contrast):
+    """apply() gives exactly the output of the original three-pass pipeline."""
+    image = np.random.default_rng(0).integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    params = {"scale": scale, "contrast": contrast}
+
+    result = EmbossContrast().apply(image, params)
+    assert result.dtype == np.uint8
+    assert np.array_equal(result, _baseline(image, scale, contrast))
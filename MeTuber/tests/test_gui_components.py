@@ -15,8 +15,7 @@ class TestStyleTabManager(unittest.TestCase):
     def setUp(self):
         self.style_categories = {"Category 1": ["Style A", "Style B"]}
         self.style_instances = {"Style A": MagicMock(), "Style B": MagicMock()}
-        self.settings = {"style": "Style A"}
-        self.manager = StyleTabManager(None, self.style_categories, self.style_instances, self.settings)
+        self.manager = StyleTabManager(None, self.style_categories, self.style_instances, current_style="Style A")
 
     def test_tabs_created(self):
         # Remove redundant init_tabs() call if already called in __init__
@@ -35,3 +34,35 @@ class TestStyleTabManager(unittest.TestCase):
         QTest.mouseClick(list_widget.viewport(), Qt.LeftButton, pos=list_widget.visualItemRect(item).center())
         # Assert the signal was emitted with "Style A"
         mock_slot.assert_called_once_with("Style A")
+
+class TestParameterControls(unittest.TestCase):
+    BLUR = {"name": "blur", "type": "int", "label": "Blur", "min": 1, "max": 9, "step": 1, "default": 3}
+    MODE = {"name": "mode", "type": "str", "label": "Mode", "options": ["A", "B"], "default": "A"}
+    EDGES = {"name": "edges", "type": "bool", "label": "Edges", "default": False}
+
+    def setUp(self):
+        self.callback = MagicMock()
+        self.controls = ParameterControls()
+        self.controls.update_parameters([self.BLUR, self.MODE], {"blur": 5}, self.callback)
+
+    def test_shared_controls_are_reused(self):
+        slider, combo = self.controls.controls["blur"], self.controls.controls["mode"]
+        self.controls.update_parameters([self.BLUR, self.EDGES, self.MODE], {"blur": 7, "mode": "B"}, self.callback)
+        self.assertIs(self.controls.controls["blur"], slider)
+        self.assertIs(self.controls.controls["mode"], combo)
+        self.assertEqual(slider.value(), 7)
+        self.assertEqual(combo.currentText(), "B")
+        # The new control lands in its own row, between the kept ones
+        self.assertIs(self.controls.form_layout.itemAt(1, self.controls.form_layout.FieldRole).widget(),
+                      self.controls.controls["edges"])
+        # Showing new values is not a user change
+        self.callback.assert_not_called()
+
+    def test_changed_controls_are_replaced(self):
+        slider = self.controls.controls["blur"]
+        wider = dict(self.BLUR, max=21)
+        self.controls.update_parameters([wider], {}, self.callback)
+        self.assertIsNot(self.controls.controls["blur"], slider)
+        self.assertEqual(self.controls.controls["blur"].maximum(), 21)
+        self.assertNotIn("mode", self.controls.controls)
+        self.assertEqual(self.controls.form_layout.rowCount(), 1)
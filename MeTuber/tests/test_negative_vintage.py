@@ -0,0 +1,64 @@
+# MeTuber\tests\test_negative_vintage.py
+
+import cv2
+import numpy as np
+import pytest
+
+from styles.base import Style
+from styles.effects.negative_vintage import NegativeVintage
+
+
+@pytest.fixture(autouse=True)
+def _variantless_styles_validate(monkeypatch):
+    """Let styles without variants validate against their base parameters."""
+    monkeypatch.setattr(Style, "validate_variant", lambda self, variant: variant is None or variant in self.variants)
+
+
+@pytest.fixture
+def image():
+    """Every uint8 value in every channel, plus random colours."""
+    ramp = np.repeat(np.arange(256, dtype=np.uint8).reshape(16, 16, 1), 3, axis=2)
+    noise = np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    return np.concatenate([ramp, noise])
+
+
+def _baseline(image, sepia_intensity):
+    """The original invert -> uint8 sepia -> scale pipeline."""
+    sepia_filter = np.array(
+        [[0.272, 0.534, 0.131],
+         [0.349, 0.686, 0.168],
+         [0.393, 0.769, 0.189]],
+        dtype=np.float32,
+    )
+    sepia = cv2.transform(cv2.bitwise_not(image), sepia_filter)
+    return np.clip(sepia * sepia_intensity, 0, 255).astype(np.uint8), sepia
+
+
+@pytest.mark.parametrize("sepia_intensity", [0.0, 0.5, 1.0, 2.0])
+def test_apply_matches_baseline_where_sepia_unsaturated(image, sepia_intensity):
+    """Outside saturated sepia, apply() only differs from the baseline by rounding."""
+    style = NegativeVintage()
+    result = style.apply(image, {"sepia_intensity": sepia_intensity})
+    # Written into the style's pooled output buffer
+    assert result is style._out(image.shape)
+
+    expected, sepia = _baseline(image, sepia_intensity)
+    unsaturated = sepia < 255
+    diff = np.abs(result.astype(np.int16) - expected)
+    assert diff[unsaturated].max() <= 1
+
+
+def test_apply_keeps_saturated_sepia_detail_below_unit_intensity(image):
+    """
+    Documented difference: the baseline saturated the sepia at 255 before
+    scaling, the fused transform scales first. Below intensity 1.0, pixels
+    whose sepia exceeded 255 therefore come out brighter than they used to.
+    """
+    result = NegativeVintage().apply(image, {"sepia_intensity": 0.5})
+    expected, sepia = _baseline(image, 0.5)
+    saturated = sepia == 255
+
+    diff = result.astype(np.int16) - expected
+    assert saturated.any()
+    assert diff[saturated].min() >= 0
+    assert diff[saturated].max() > 1
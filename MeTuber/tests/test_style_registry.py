@@ -0,0 +1,75 @@
+import cv2
+import numpy as np
+import pytest
+from styles.adjustments.blur import BlurStyle
+from styles.adjustments.gamma_correction import GammaCorrection
+from styles.adjustments.solarize import Solarize
+from styles.base import Style
+from styles.basic.contrast_only import ContrastOnly
+from styles.color_filters.negative import Negative
+from styles.registry import get_processor
+
+
+@pytest.fixture(autouse=True)
+def _variantless_styles_validate(monkeypatch):
+    """Let styles without variants validate against their base parameters."""
+    monkeypatch.setattr(Style, "validate_variant", lambda self, variant: variant is None or variant in self.variants)
+
+
+@pytest.fixture
+def dummy_image():
+    """Random BGR frame so every code path sees real data."""
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (40, 60, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def gamma(monkeypatch):
+    monkeypatch.setattr(GammaCorrection, "__abstractmethods__", frozenset())
+    monkeypatch.setattr(GammaCorrection, "define_parameters", lambda self: list(GammaCorrection.parameters))
+    return GammaCorrection()
+
+
+def test_blur_processor_matches_style(dummy_image):
+    style = BlurStyle()
+    process = get_processor(style, {"kernel_size": 4})
+    assert np.array_equal(process(dummy_image), style.apply(dummy_image, {"kernel_size": 4}))
+
+
+def test_blur_processor_follows_fast_flag(dummy_image):
+    style = BlurStyle()
+    style.fast = False
+    process = get_processor(style, {"kernel_size": 31})
+    assert np.array_equal(process(dummy_image), cv2.GaussianBlur(dummy_image, (31, 31), 0))
+
+
+def test_contrast_processor_clamps_like_style(dummy_image):
+    style = ContrastOnly()
+    process = get_processor(style, {"contrast": 5.0})
+    assert np.array_equal(process(dummy_image), style.apply(dummy_image, {"contrast": 5.0}))
+
+
+def test_out_of_range_gamma_is_clamped(gamma, dummy_image):
+    process = get_processor(gamma, {"gamma": 0})
+    assert process is not None
+    assert process(dummy_image).shape == dummy_image.shape
+
+
+def test_processor_is_memoized():
+    style = Solarize()
+    assert get_processor(style, {"threshold": 90}) is get_processor(style, {"threshold": 90})
+
+
+def test_unregistered_style_falls_back():
+    assert get_processor(Negative(), {}) is None
+
+
+def test_factory_errors_fall_back(monkeypatch):
+    style = Solarize()
+    monkeypatch.setattr(style, "validate_params", lambda params: 1 / 0)
+    assert get_processor(style, {"threshold": 90}) is None
+
+
+def test_identity_params_return_input(gamma, dummy_image):
+    process = get_processor(gamma, {"gamma": 1.0})
+    assert process(dummy_image) is dummy_image
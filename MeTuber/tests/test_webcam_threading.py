@@ -1,38 +1,30 @@
 # MeTuber\tests\test_webcam_threading.py
 
+import itertools
+import queue
+import threading
+from types import MappingProxyType, SimpleNamespace
+
+import cv2
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 from styles.effects.original import Original
-from pyvirtualcam import PixelFormat
 from webcam_threading import WebcamThread
 
 @pytest.mark.usefixtures("qapp")
 class TestWebcamThreading:
     """Test cases for WebcamThread class."""
 
-    @pytest.fixture
-    def webcam_thread(self, request):
-        """Fixture to manage WebcamThread lifecycle."""
-        thread = None
-        def cleanup():
-            if thread is not None and thread.is_alive():
-                thread.stop()
-                thread.join(timeout=5)
-        request.addfinalizer(cleanup)
-        return thread
-
-    @pytest.fixture(autouse=True)
-    def setup_test(self, qtbot):
-        """Setup test environment."""
-        self.qtbot = qtbot
-        yield
-
     @patch('webcam_threading.av.open')
     @patch('webcam_threading.pyvirtualcam.Camera')
-    def test_thread_initialization(self, mock_camera, mock_av_open, webcam_thread, qtbot):
+    def test_thread_initialization(self, mock_camera, mock_av_open):
         """Test if WebcamThread initializes correctly."""
         mock_av_instance = MagicMock()
         mock_av_open.return_value = mock_av_instance
+        mock_av_instance.decode.return_value = [MagicMock()]
+        video_stream = mock_av_instance.streams.video[0]
+        video_stream.width, video_stream.height = 640, 480
 
         mock_cam_instance = MagicMock()
         mock_camera.return_value.__enter__.return_value = mock_cam_instance
@@ -41,20 +33,150 @@ class TestWebcamThreading:
         params = {}
 
         thread = WebcamThread("video=TestDevice", style, params)
-        webcam_thread = thread  # Assign to fixture for cleanup
-        
-        with qtbot.waitSignal(thread.started, timeout=5000):
-            thread.start()
+
+        # All I/O is mocked, so the capture loop ends after the one frame
+        thread.start()
+        assert thread.wait(2000)
 
         # Ensure av.open was called with the correct device
-        mock_av_open.assert_called_with("video=TestDevice", format="dshow")
+        mock_av_open.assert_called_with("video=TestDevice", options=thread.input_options, timeout=0.1)
+
+        # The camera takes the stream's size, at no more than 15 fps
+        mock_camera.assert_called_with(width=640, height=480, fps=min(thread.max_fps, 15))
+
+        assert not thread.running  # Using pytest style assertions
+
+    def test_update_params_latest_wins(self):
+        """While running, only the newest parameters reach the style worker."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        seen = []
+
+        def decode(**kwargs):
+            for value in range(3):
+                thread.update_params({"value": value})
+            seen.append(thread.style_params)
+            return iter(())
+
+        with patch('webcam_threading.av.open') as mock_av_open, \
+                patch('webcam_threading.pyvirtualcam.Camera'):
+            mock_av_open.return_value.decode.side_effect = decode
+            thread.start()
+            assert thread.wait(2000)
+
+        # Queued while running; picked up once the thread stopped
+        assert seen == [{}]
+        assert not thread.running
+        assert thread.style_params == {"value": 2}
+        # Nothing new since: the next frame keeps the processor it has
+        with patch.object(thread, "_resolve_processor") as resolve:
+            thread._take_pending_params()
+        resolve.assert_not_called()
+
+    def test_stop_before_run_is_not_lost(self):
+        """A stop() issued before run() gets going still ends the thread."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        started = threading.Event()
+
+        def open_device(*args, **kwargs):
+            started.wait(2)
+            stream = MagicMock()
+            stream.decode.return_value = itertools.repeat(MagicMock())
+            return stream
+
+        with patch('webcam_threading.av.open', side_effect=open_device), \
+                patch('webcam_threading.pyvirtualcam.Camera'):
+            thread.start()
+            thread.running = False
+            started.set()
+            assert thread.wait(2000)
+        assert not thread.running
+
+    def test_worker_survives_parameter_errors(self):
+        """A failing parameter update skips the frame instead of killing the worker."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        frame_queue = queue.Queue()
+        frame_queue.put(np.zeros((4, 4, 3), dtype=np.uint8))
+        frame_queue.put(None)
+
+        with patch.object(thread, "_take_pending_params", side_effect=RuntimeError("boom")):
+            thread._process_frames(frame_queue, MagicMock())
+        assert thread.frames_processed == 0
+
+    def test_update_params_keeps_read_only_snapshot(self):
+        """Read-only snapshots are shared; plain dicts are copied."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        snapshot = MappingProxyType({"value": 1})
+        thread.update_params(snapshot)
+        assert thread.style_params is snapshot
+
+        params = {"value": 2}
+        thread.update_params(params)
+        assert thread.style_params == params and thread.style_params is not params
+
+    def test_enqueue_latest_drops_oldest(self):
+        """A full frame queue evicts its oldest frame instead of blocking capture."""
+        frame_queue = queue.Queue(maxsize=2)
+
+        assert not WebcamThread._enqueue_latest(frame_queue, "frame1")
+        assert not WebcamThread._enqueue_latest(frame_queue, "frame2")
+        assert WebcamThread._enqueue_latest(frame_queue, "frame3")
+
+        assert [frame_queue.get_nowait() for _ in range(2)] == ["frame2", "frame3"]
+
+    def test_fit_to_camera(self):
+        """Matching frames pass through; others are converted to the camera's format."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        cam = SimpleNamespace(width=8, height=6)
+        frame = np.zeros((6, 8, 3), dtype=np.uint8)
+        assert thread._fit_to_camera(frame, cam) is frame
+        assert thread._fit_to_camera(np.zeros((6, 8), dtype=np.uint8), cam).shape == (6, 8, 3)
+        assert thread._fit_to_camera(np.zeros((3, 4, 3), dtype=np.uint8), cam).shape == (6, 8, 3)
+
+    def test_fit_to_camera_cuda_fallback(self):
+        """A failing CUDA resize falls back to the CPU for good."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        thread._use_cuda_resize = True
+        cam = SimpleNamespace(width=8, height=6)
+        with patch("webcam_threading.cv2.cuda_GpuMat", side_effect=cv2.error("no CUDA")):
+            resized = thread._fit_to_camera(np.zeros((3, 4, 3), dtype=np.uint8), cam)
+        assert resized.shape == (6, 8, 3)
+        assert not thread._use_cuda_resize
+
+    def test_last_frame_copied_only_for_pooled_output(self):
+        """Fresh processor output is kept as is; style-owned buffers are copied."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        cam = MagicMock(width=8, height=6)
+        frame = np.zeros((6, 8, 3), dtype=np.uint8)
+        for owned in (True, False):
+            thread._processor = lambda image: image
+            thread._processor_output_owned = owned
+            frame_queue = queue.Queue()
+            frame_queue.put(frame)
+            frame_queue.put(None)
+            thread._process_frames(frame_queue, cam)
+            assert (thread.last_frame is frame) == owned
+            assert np.array_equal(thread.last_frame, frame)
+
+    def test_configure_decoder_low_latency(self):
+        """Slice threading only, with the codec's low-delay flag set."""
+        import av.codec.context
 
-        # Ensure pyvirtualcam.Camera was initialized correctly
-        mock_camera.assert_called_with(width=640, height=480, fps=30, fmt=PixelFormat.BGR)
+        stream = SimpleNamespace(codec_context=SimpleNamespace(flags=0))
+        WebcamThread._configure_decoder(stream)
+        assert stream.thread_type == "SLICE"
+        assert stream.thread_count >= 2
+        assert stream.codec_context.flags & av.codec.context.Flags.low_delay
 
-        # Stop the thread
-        with qtbot.waitSignal(thread.finished, timeout=5000):
-            thread.stop()
-            thread.wait()
+    def test_frame_to_bgr_without_threads_argument(self):
+        """PyAV versions without to_ndarray(threads=...) fall back for good."""
+        thread = WebcamThread("video=TestDevice", Original(), {})
+        def to_ndarray(format, **kwargs):
+            if kwargs:
+                raise TypeError("unexpected keyword argument 'threads'")
+            return format
 
-        assert not thread._is_running  # Using pytest style assertions
+        frame = MagicMock(spec_set=["to_ndarray"])
+        frame.to_ndarray.side_effect = to_ndarray
+        assert thread._frame_to_bgr(frame) == "bgr24"
+        assert thread._frame_to_bgr(frame) == "bgr24"
+        assert frame.to_ndarray.call_count == 3
@@ -1,24 +1,36 @@
 # webcam_filter_pyqt5.py
 
+import atexit
+import concurrent.futures
+import copy
+import functools
+import hashlib
 import inspect
 import sys
 import os
 import json
+import queue
+import re
 import subprocess
-import av
+import time
 import cv2
-import numpy as np
-import pyvirtualcam
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 import pkgutil
 import importlib
+import importlib.util
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGroupBox,
     QFormLayout, QSlider, QPushButton, QMessageBox, QFileDialog, QComboBox, QTabWidget, QCheckBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QCoreApplication, QTimer, QRunnable, QThreadPool
 import traceback
+from types import MappingProxyType
+
+try:
+    import orjson  # Optional: faster settings (de)serialization
+except ImportError:
+    orjson = None
 
 # Import GUI components
 from gui_components.device_selector import DeviceSelector
@@ -38,83 +50,457 @@ from styles.artistic.advanced_cartoon2 import AdvancedCartoonAnime # Updated imp
 # Import the updated WebcamThread
 from webcam_threading import WebcamThread  # Ensure this path is correct
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # 1. Config Load/Save
 # =============================================================================
 
 CONFIG_FILE = "config.json"
 
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.path.join(_MODULE_DIR, 'snapshots')
+
+# Delay before queued settings are written, so a burst of edits costs one write.
+# Pending settings are also flushed on stop, on close and at exit.
+SETTINGS_FLUSH_DELAY_MS = 2000
+# Delay before slider changes reach the running thread (about one frame).
+PARAMS_PUSH_DELAY_MS = 33
+# Longest the window waits on close for snapshots still being written.
+SNAPSHOT_WAIT_MS = 3000
+
+# Parsed config.json and the mtime it was read at; re-read only when it changes.
+_SETTINGS_CACHE = None
+_SETTINGS_MTIME = None
+# Latest settings passed to save_settings() that are not on disk yet.
+_PENDING_SETTINGS = None
+_FLUSH_SCHEDULED = False
+
+def _config_mtime():
+    try:
+        return os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        return None
+
 def load_settings():
     """Load settings from a JSON file if it exists; otherwise use defaults."""
+    global _SETTINGS_CACHE, _SETTINGS_MTIME
     default_settings = {
         "input_device": "video=C270 HD WEBCAM",  # Example default
         "style": "Original",
         "parameters": {},
-        "snapshot_dir": os.path.join(os.path.dirname(os.path.abspath(__file__)), 'snapshots') # Add default snapshot directory
+        "snapshot_dir": SNAPSHOT_DIR # Add default snapshot directory
     }
     if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                loaded = json.load(f)
-                default_settings.update(loaded)
-        except (json.JSONDecodeError, IOError):
-            logging.warning("Failed to load config.json. Using default settings.")
+        mtime = _config_mtime()
+        if _SETTINGS_CACHE is None or mtime is None or mtime != _SETTINGS_MTIME:
+            try:
+                if orjson is not None:
+                    with open(CONFIG_FILE, "rb") as f:
+                        _SETTINGS_CACHE = orjson.loads(f.read())
+                else:
+                    with open(CONFIG_FILE, "r") as f:
+                        _SETTINGS_CACHE = json.load(f)
+                _SETTINGS_MTIME = mtime
+            except (ValueError, IOError):  # JSONDecodeError and orjson's error are ValueErrors
+                logging.warning("Failed to load config.json. Using default settings.")
+                _SETTINGS_CACHE = _SETTINGS_MTIME = None
+        if _SETTINGS_CACHE is not None:
+            # Callers mutate nested dicts, so never hand out the cached ones
+            default_settings.update(copy.deepcopy(_SETTINGS_CACHE))
     return default_settings
 
 def save_settings(settings):
-    """Save current settings to a JSON file."""
+    """
+    Queue settings to be saved to the JSON file.
+
+    Calls are coalesced: with a Qt application running, the latest settings
+    are written once SETTINGS_FLUSH_DELAY_MS after the first unsaved change.
+    Without one, they are written immediately. flush_settings() forces it.
+    """
+    global _PENDING_SETTINGS, _FLUSH_SCHEDULED
+    _PENDING_SETTINGS = settings
+    if QCoreApplication.instance() is None:
+        flush_settings()
+    elif not _FLUSH_SCHEDULED:
+        _FLUSH_SCHEDULED = True
+        QTimer.singleShot(SETTINGS_FLUSH_DELAY_MS, flush_settings)
+
+def _sync_to_disk(f):
+    """Flush ``f`` through to the disk, so a crash right after os.replace cannot leave an empty file."""
+    f.flush()
+    os.fsync(f.fileno())
+
+def flush_settings():
+    """Write queued settings to the JSON file, atomically replacing it."""
+    global _PENDING_SETTINGS, _FLUSH_SCHEDULED, _SETTINGS_CACHE, _SETTINGS_MTIME
+    _FLUSH_SCHEDULED = False
+    settings, _PENDING_SETTINGS = _PENDING_SETTINGS, None
+    if settings is None:
+        return
+    tmp_file = f"{CONFIG_FILE}.tmp"
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(settings, f, indent=4)
-    except IOError as e:
+        if orjson is not None:
+            data = orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                _sync_to_disk(f)
+        else:
+            with open(tmp_file, "w") as f:
+                json.dump(settings, f, indent=4)
+                _sync_to_disk(f)
+        os.replace(tmp_file, CONFIG_FILE)
+    except (IOError, OSError) as e:
         logging.error(f"Error saving settings: {e}")
+        return
+    # What we just wrote is what the next load_settings() would read
+    _SETTINGS_CACHE = copy.deepcopy(settings)
+    _SETTINGS_MTIME = _config_mtime()
+
+def _settings_digest(parameters, styles):
+    """
+    Short content hash of the stored style parameters and the definitions of
+    the ``(name, style)`` pairs they were validated against, or None if they
+    cannot be serialized.
+    """
+    definitions = [
+        [name, [[p.get("name"), p.get("type"), p.get("min"), p.get("max"), p.get("options")]
+                for p in style.parameters]]
+        for name, style in styles
+    ]
+    try:
+        if orjson is not None:
+            data = orjson.dumps(
+                [parameters, definitions], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            data = json.dumps([parameters, definitions], sort_keys=True).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+# Do not lose a pending write if the process exits before the timer fires
+atexit.register(flush_settings)
 
 # =============================================================================
 # 2. Device Enumeration (Windows-Only)
 # =============================================================================
 
-def list_devices():
+# Device list shared across sessions, so startup skips the FFmpeg probe.
+DEVICES_CACHE_FILE = os.environ.get(
+    "METUBER_DEVICES_CACHE", os.path.expanduser("~/.metuber_devices.json")
+)
+DEVICES_CACHE_TTL = 600  # seconds
+DEVICE_PROBE_TIMEOUT = 2  # seconds; a hung FFmpeg must not stall a refresh
+# Keep the FFmpeg probe from flashing a console window on Windows.
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+def _read_json(path):
+    """Parse a JSON sidecar file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+def _write_json(path, obj):
+    """Write ``obj`` as compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        data = orjson.dumps(obj)
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f)
+
+def _read_devices_cache(fresh_only=True):
     """
-    List DirectShow devices on Windows using FFmpeg.
-    Returns a list of fully qualified device names, e.g. ["video=C270 HD WEBCAM", ...].
+    Return the device names from the sidecar cache, or None if it is missing
+    (or, with ``fresh_only``, older than DEVICES_CACHE_TTL).
+    """
+    try:
+        cache = _read_json(DEVICES_CACHE_FILE)
+        if not fresh_only or time.time() - cache["ts"] < DEVICES_CACHE_TTL:
+            return tuple(cache["devices"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _write_devices_cache(devices):
+    """Store device names in the sidecar cache, atomically replacing it."""
+    tmp_file = f"{DEVICES_CACHE_FILE}.tmp"
+    try:
+        _write_json(tmp_file, {"ts": time.time(), "devices": list(devices)})
+        os.replace(tmp_file, DEVICES_CACHE_FILE)
+    except OSError as e:
+        logging.debug(f"Could not write device cache: {e}")
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_devices():
+    """Return the DirectShow device names as a tuple, from the sidecar cache if fresh."""
+    devices = _read_devices_cache()
+    if devices is None:
+        devices = _dshow_devices()
+    if devices is None:
+        devices = _probe_devices()
+        if devices:  # never cache a failed or empty probe
+            _write_devices_cache(devices)
+    return devices
+
+# DirectShow class IDs for enumerating video inputs in-process.
+_CLSID_SYSTEM_DEVICE_ENUM = "{62BE5D10-60EB-11D0-BD3B-00A0C911CE86}"
+_CLSID_VIDEO_INPUT_DEVICE_CATEGORY = "{860BB310-5D01-11D0-BD3B-00A0C911CE86}"
+
+def _dshow_devices():
+    """
+    Enumerate DirectShow video inputs through COM, without launching FFmpeg.
+    Returns None when that is unavailable (not Windows, comtypes missing, or
+    any COM failure) so the caller can fall back to the FFmpeg probe.
     """
-    devices = []
+    if sys.platform != "win32":
+        return None
+    try:
+        from comtypes import GUID
+        from comtypes.client import CreateObject, GetModule
+        from comtypes.persist import IPropertyBag
+
+        qedit = GetModule("qedit.dll")
+        dev_enum = CreateObject(GUID(_CLSID_SYSTEM_DEVICE_ENUM), interface=qedit.ICreateDevEnum)
+        monikers = dev_enum.CreateClassEnumerator(GUID(_CLSID_VIDEO_INPUT_DEVICE_CATEGORY), dwFlags=0)
+        devices = []
+        if monikers:  # NULL (S_FALSE) when the category has no devices
+            moniker, fetched = monikers.Next(1)
+            while fetched:
+                bag = moniker.BindToStorage(0, 0, IPropertyBag._iid_).QueryInterface(IPropertyBag)
+                devices.append(f"video={bag.Read('FriendlyName', pErrorLog=None)}")
+                moniker, fetched = monikers.Next(1)
+        return tuple(devices)
+    except Exception as e:
+        logging.debug(f"DirectShow enumeration unavailable, falling back to FFmpeg: {e}")
+        return None
+
+# A device line in FFmpeg's dshow listing: [dshow @ 0x...]  "Device Name"
+# ("Alternative name" lines carry text before the quote and are skipped).
+_DSHOW_DEVICE_RE = re.compile(r'^\s*\[dshow[^\]]*\]\s+"([^"]+)"')
+
+def _probe_devices():
+    """Run FFmpeg once and return the DirectShow device names as a tuple."""
     cmd = ['ffmpeg', '-list_devices', 'true', '-f', 'dshow', '-i', 'dummy']
     try:
-        output = subprocess.check_output(cmd, stderr=subprocess.STDOUT).decode('utf-8', errors='ignore')
-        for line in output.splitlines():
-            line = line.strip()
-            if line.startswith("[dshow") and '"' in line:
-                start_idx = line.find('"')
-                end_idx = line.rfind('"')
-                if start_idx != -1 and end_idx != -1:
-                    device_name = line[start_idx + 1:end_idx]
-                    devices.append(f"video={device_name}")
-    except subprocess.CalledProcessError as e:
+        # FFmpeg prints the list on stderr and always exits non-zero (the
+        # "dummy" input never opens), so read the stream rather than the status.
+        with subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors='ignore',
+            creationflags=_NO_WINDOW
+        ) as proc:
+            try:
+                _, output = proc.communicate(timeout=DEVICE_PROBE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                logging.warning(f"FFmpeg did not list devices within {DEVICE_PROBE_TIMEOUT}s; stopping it.")
+                proc.kill()
+                _, output = proc.communicate()
+    except OSError as e:
         logging.error(f"Could not enumerate devices using FFmpeg: {e}")
-    return devices
+        return ()
+    matches = map(_DSHOW_DEVICE_RE.match, (output or "").splitlines())
+    return tuple(f"video={match.group(1)}" for match in matches if match)
+
+def list_devices(refresh=False):
+    """
+    List DirectShow devices on Windows using FFmpeg.
+    The FFmpeg probe is cached for the process and in DEVICES_CACHE_FILE for
+    DEVICES_CACHE_TTL seconds; pass refresh=True to re-run it.
+    Returns a list of fully qualified device names, e.g. ["video=C270 HD WEBCAM", ...].
+    """
+    if refresh:
+        _enumerate_devices.cache_clear()
+        try:
+            os.remove(DEVICES_CACHE_FILE)
+        except OSError:
+            pass
+    return list(_enumerate_devices())
+
+def cached_devices():
+    """
+    Return ``(devices, fresh)`` without probing anything: the last known
+    device names (from this process or the sidecar cache, whatever its age)
+    and whether they are recent enough that list_devices() would reuse them.
+    """
+    if _enumerate_devices.cache_info().currsize:
+        return list(_enumerate_devices()), True
+    fresh = _read_devices_cache()
+    if fresh is not None:
+        return list(fresh), True
+    return list(_read_devices_cache(fresh_only=False) or ()), False
 
 # =============================================================================
 # 3. Dynamic Style Loading
 # =============================================================================
 
-def load_styles():
+# Threads used to import style modules; the .pyc reads overlap while one thread parses.
+STYLE_IMPORT_WORKERS = 8
+
+def _is_style_candidate(modname):
+    """False for test and private (underscore) modules or anything inside such packages."""
+    return not any(
+        part in ("test", "tests") or part.startswith(("test_", "_"))
+        for part in modname.split(".")
+    )
+
+def _log_walk_error(pkg_name):
+    logging.error(f"Error scanning package {pkg_name}")
+
+def _may_define_styles(modname):
+    """
+    Cheap pre-import check: a module whose source never mentions ``Style``
+    cannot define a Style subclass. Returns True when the source is unavailable.
+    """
+    try:
+        spec = importlib.util.find_spec(modname)
+    except (ImportError, ValueError):
+        return True
+    origin = getattr(spec, "origin", None)
+    if not origin or not origin.endswith(".py"):
+        return True
+    try:
+        with open(origin, "rb") as f:
+            return b"Style" in f.read()
+    except OSError:
+        return True
+
+def _import_style_module(modname):
+    """Import one style module, returning None (and logging) if it fails or is skipped."""
+    logging.debug(f"Found module: {modname}")
+    if not _may_define_styles(modname):
+        logging.debug(f"Skipping module without styles: {modname}")
+        return None
+    try:
+        return importlib.import_module(modname)
+    except Exception as module_error:
+        logging.error(f"Failed to load module '{modname}': {module_error}")
+        return None
+
+# Style discovery result, reused while no module under styles/ has changed.
+STYLES_MANIFEST_FILE = os.environ.get(
+    "METUBER_STYLES_MANIFEST", os.path.expanduser("~/.metuber_styles.json")
+)
+
+class _StyleLoader:
+    """Imports and instantiates one style class on demand."""
+    __slots__ = ("module", "cls_name")
+
+    def __init__(self, module, cls_name):
+        self.module = module
+        self.cls_name = cls_name
+
+    def __call__(self):
+        return getattr(importlib.import_module(self.module), self.cls_name)()
+
+class LazyStyleDict(dict):
+    """
+    Style instances keyed by name. An entry may still be a ``_StyleLoader``;
+    it is replaced by the instance the first time the style is looked up.
+    Iterating ``items()``/``values()`` loads every style; use ``loaded_items()``
+    to see only the ones already instantiated.
+    """
+    def __getitem__(self, name):
+        value = super().__getitem__(name)
+        if isinstance(value, _StyleLoader):
+            try:
+                value = value()
+            except Exception as e:
+                logging.error(f"Failed to load style '{name}': {e}")
+                super().__delitem__(name)
+                raise KeyError(name) from e
+            super().__setitem__(name, value)
+        return value
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def values(self):
+        return [self[name] for name in list(self)]
+
+    def items(self):
+        return [(name, self[name]) for name in list(self)]
+
+    def loaded_items(self):
+        return [(name, value) for name, value in super().items() if not isinstance(value, _StyleLoader)]
+
+def _module_mtime(module_finder, modname):
+    """mtime of a discovered module's source file, or None if it cannot be stat'ed."""
+    path = os.path.join(getattr(module_finder, "path", ""), modname.rpartition(".")[2] + ".py")
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+def _read_styles_manifest():
+    """
+    Return the cached discovery results as
+    ``{module: {"mtime": float, "styles": [[name, class, category], ...]}}``,
+    or an empty dict if the manifest is missing or unreadable.
+    """
+    try:
+        modules = _read_json(STYLES_MANIFEST_FILE)["modules"]
+        if isinstance(modules, dict):
+            return modules
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+def _write_styles_manifest(modules):
+    """Store per-module discovery results, atomically replacing the manifest."""
+    tmp_file = f"{STYLES_MANIFEST_FILE}.tmp"
+    try:
+        _write_json(tmp_file, {"modules": modules})
+        os.replace(tmp_file, STYLES_MANIFEST_FILE)
+    except OSError as e:
+        logging.debug(f"Could not write styles manifest: {e}")
+
+def _add_style(style_instances, style_categories, name, category, style):
+    """
+    Register a style instance (or loader) under its name and category.
+    ``style_categories`` maps each category to a dict used as an ordered
+    set, so a repeated name is ignored without scanning the list.
+    """
+    style_categories.setdefault(category, {})[name] = None
+    style_instances[name] = style
+
+# (style_instances, style_categories) from the first load_styles() call.
+_STYLES_CACHE = None
+
+def load_styles(refresh=False):
     """
     Dynamically loads all Style subclasses from the styles package and categorizes them.
 
+    Discovery runs once per process and every caller (e.g. each WebcamApp)
+    shares its result; pass refresh=True to run it again. Styles declaring
+    ``name`` as a class attribute are instantiated on first lookup. Modules
+    whose mtime matches the cached manifest are not even imported until one
+    of their styles is looked up; only new or changed modules are scanned.
+
     Returns:
         tuple: 
             - A dictionary of style instances keyed by their names.
             - A dictionary of categories with lists of style names.
     """
-    style_instances = {}
-    style_categories = {}
+    global _STYLES_CACHE
+    if _STYLES_CACHE is None or refresh:
+        _STYLES_CACHE = _discover_styles()
+    return _STYLES_CACHE
+
+def _discover_styles():
+    """Scan the style packages; see load_styles()."""
+    style_instances = LazyStyleDict()
 
     # List of all style-related packages to scan
     packages_to_scan = ['styles']
 
-    seen_classes = set()
-
+    module_infos = []
     for pkg_name in packages_to_scan:
         logging.debug(f"Scanning package: {pkg_name}")
         try:
@@ -123,44 +509,85 @@ def load_styles():
             logging.error(f"Error loading package {pkg_name}: {e}")
             continue
 
-        for _, modname, ispkg in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
-            if ispkg:
-                continue
-
-            logging.debug(f"Found module: {modname}")
-            try:
-                module = importlib.import_module(modname)
-
-                for cls_name in dir(module):
-                    cls = getattr(module, cls_name)
-                    if (
-                        inspect.isclass(cls) and
-                        issubclass(cls, Style) and
-                        cls is not Style and
-                        not inspect.isabstract(cls) and
-                        cls not in seen_classes
-                    ):
-                        try:
-                            instance = cls()  # Instantiate
-                            seen_classes.add(cls)
-
-                            category = getattr(instance, "category", "Uncategorized")
-                            if category not in style_categories:
-                                style_categories[category] = []
-
-                            # Avoid duplicate style names in the same category
-                            if instance.name not in style_categories[category]:
-                                style_categories[category].append(instance.name)
-
-                            style_instances[instance.name] = instance
-                            logging.info(f"Loaded style: {instance.name} (Category: {category})")
-
-                        except Exception as instantiation_error:
-                            logging.error(f"Failed to instantiate style '{cls.__name__}': {instantiation_error}")
-
-            except Exception as module_error:
-                logging.error(f"Failed to load module '{modname}': {module_error}")
-
+        module_infos.extend(
+            (module_finder, modname)
+            for module_finder, modname, ispkg in pkgutil.walk_packages(
+                package.__path__, package.__name__ + ".", onerror=_log_walk_error
+            )
+            if not ispkg and _is_style_candidate(modname)
+        )
+    # Discovery order no longer depends on how the filesystem lists directories
+    module_infos.sort(key=lambda info: info[1])
+
+    # Reuse the manifest entry of every module whose file is unchanged
+    cached = _read_styles_manifest()
+    manifest = {}
+    modnames = []
+    for module_finder, modname in module_infos:
+        mtime = _module_mtime(module_finder, modname)
+        entry = cached.get(modname)
+        if mtime is not None and entry is not None and entry.get("mtime") == mtime:
+            manifest[modname] = entry
+        else:
+            manifest[modname] = {"mtime": mtime, "styles": None}
+            modnames.append(modname)
+    if len(modnames) < len(module_infos):
+        logging.info(f"Reusing the manifest for {len(module_infos) - len(modnames)} unchanged style modules")
+
+    # Imports run in parallel; map() keeps discovery order, and the class
+    # scan below stays on this thread so seen_classes needs no lock.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=STYLE_IMPORT_WORKERS) as executor:
+        modules = list(executor.map(_import_style_module, modnames))
+
+    # Importing a module registered its Style subclasses (Style.__init_subclass__);
+    # group them by defining module so discovery follows the module order.
+    module_classes = {}
+    for cls in list(Style._registry.values()):
+        module_classes.setdefault(cls.__module__, []).append(cls)
+
+    scanned = {}
+    for module in modules:
+        if module is None:
+            continue
+        entries = manifest[module.__name__]["styles"] = []
+
+        # Sorted by name, the order dir() used to give
+        for cls in sorted(module_classes.get(module.__name__, ()), key=lambda c: c.__name__):
+            # Only module-level, concrete classes can be loaded by name
+            if cls.__qualname__ == cls.__name__ and not inspect.isabstract(cls):
+                # Styles that declare their name on the class are instantiated
+                # on first lookup; the rest set it in __init__ and must be built now.
+                if "name" in vars(cls):
+                    name = cls.name
+                    category = getattr(cls, "category", "Uncategorized")
+                    entries.append([name, cls.__name__, category])
+                    logging.info(f"Found style: {name} (Category: {category})")
+                    continue
+
+                try:
+                    instance = cls()  # Instantiate
+
+                    category = getattr(instance, "category", "Uncategorized")
+                    scanned[(module.__name__, cls.__name__)] = instance
+                    entries.append([instance.name, cls.__name__, category])
+                    logging.info(f"Loaded style: {instance.name} (Category: {category})")
+
+                except Exception as instantiation_error:
+                    logging.error(f"Failed to instantiate style '{cls.__name__}': {instantiation_error}")
+
+    # Register in module order; styles not instantiated above load on first lookup
+    category_names = {}
+    for modname, entry in manifest.items():
+        for name, cls_name, category in entry["styles"] or ():
+            style = scanned.get((modname, cls_name)) or _StyleLoader(modname, cls_name)
+            _add_style(style_instances, category_names, name, category, style)
+    style_categories = {category: list(names) for category, names in category_names.items()}
+
+    # Modules that failed to import (styles None) or cannot be stat'ed are retried next time
+    _write_styles_manifest({
+        modname: entry for modname, entry in manifest.items()
+        if entry["styles"] is not None and entry["mtime"] is not None
+    })
     return style_instances, style_categories
 
 # =============================================================================
@@ -170,10 +597,24 @@ def load_styles():
 # Debug mode flag (can be set via config or env)
 DEBUG_MODE = os.environ.get("METUBER_DEBUG", "0") == "1"
 
-SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'snapshots')
 if not os.path.exists(SNAPSHOT_DIR):
     os.makedirs(SNAPSHOT_DIR)
 
+# Upper bound on threads used to stat 'file' parameter paths.
+PATH_CHECK_WORKERS = 8
+
+def _paths_exist(paths):
+    """
+    Map each unique non-empty path to ``os.path.exists``. Paths are checked
+    once each, in parallel, so slow (e.g. network) drives block only once.
+    """
+    unique_paths = list(dict.fromkeys(path for path in paths if path))
+    if len(unique_paths) < 2:
+        return {path: os.path.exists(path) for path in unique_paths}
+    workers = min(PATH_CHECK_WORKERS, len(unique_paths))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(unique_paths, executor.map(os.path.exists, unique_paths)))
+
 
 def show_error_dialog(parent, message, exc=None):
     """Show a critical error dialog and log the error. If exc is provided, log with traceback."""
@@ -186,6 +627,68 @@ def show_error_dialog(parent, message, exc=None):
     QMessageBox.critical(parent, "Error", message)
 
 
+class SnapshotSignals(QObject):
+    """Reports the outcome of a SnapshotWriter back to the GUI thread."""
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class SnapshotWriter(QRunnable):
+    """Encodes and writes one snapshot on a QThreadPool worker."""
+    def __init__(self, frame, path, signals):
+        super().__init__()
+        self.frame = frame
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            saved = cv2.imwrite(self.path, self.frame)
+        except cv2.error as e:
+            logging.error(f"Failed to encode snapshot '{self.path}': {e}")
+            saved = False
+        if saved:
+            self.signals.saved.emit(self.path)
+        else:
+            self.signals.failed.emit(self.path)
+
+
+class StyleDiscoverySignals(QObject):
+    """Delivers load_styles() results from a StyleDiscoveryTask to the GUI thread."""
+    loaded = pyqtSignal(object, object)  # style_instances, style_categories
+
+
+class StyleDiscoveryTask(QRunnable):
+    """Runs the first load_styles() on a QThreadPool worker."""
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        try:
+            style_instances, style_categories = load_styles()
+        except Exception as e:
+            logging.error(f"Style discovery failed: {e}", exc_info=True)
+            style_instances, style_categories = LazyStyleDict(), {}
+        self.signals.loaded.emit(style_instances, style_categories)
+
+
+class DeviceProbeSignals(QObject):
+    """Delivers list_devices() results from a DeviceProbeTask to the GUI thread."""
+    found = pyqtSignal(list)
+
+
+class DeviceProbeTask(QRunnable):
+    """Runs list_devices() on a QThreadPool worker."""
+    def __init__(self, signals, refresh=False):
+        super().__init__()
+        self.signals = signals
+        self.refresh = refresh
+
+    def run(self):
+        self.signals.found.emit(list_devices(refresh=self.refresh))
+
+
 class WebcamApp(QWidget):
     """
     Main GUI application that manages device selection, style parameters,
@@ -198,9 +701,34 @@ class WebcamApp(QWidget):
 
         # Thread & style management
         self.thread = None
-        self.style_instances, self.style_categories = load_styles()
+        # Reuse an earlier discovery; otherwise the window opens with empty
+        # style tabs and a background task fills them in (_on_styles_loaded).
+        styles_ready = _STYLES_CACHE is not None
+        if styles_ready:
+            self.style_instances, self.style_categories = load_styles()
+        else:
+            self.style_instances, self.style_categories = LazyStyleDict(), {}
         self.current_style = None
         self.current_style_params = {}
+        # Names of the styles whose saved parameters were validated this session
+        self._validated_styles = set()
+
+        # Coalesce slider ticks into one update_params() per frame interval
+        self._params_timer = QTimer(self)
+        self._params_timer.setSingleShot(True)
+        self._params_timer.setInterval(PARAMS_PUSH_DELAY_MS)
+        self._params_timer.timeout.connect(self._flush_params)
+
+        # Device probes run on the global thread pool; results come back here
+        self._device_probe_signals = DeviceProbeSignals(self)
+        self._device_probe_signals.found.connect(self._on_devices_found)
+
+        # Snapshots are encoded on their own thread pool, so closing the window
+        # waits for them but not for device probes or style discovery
+        self._snapshot_pool = QThreadPool(self)
+        self._snapshot_signals = SnapshotSignals(self)
+        self._snapshot_signals.saved.connect(self.on_snapshot_saved)
+        self._snapshot_signals.failed.connect(self.on_snapshot_failed)
 
         # Config settings
         self.settings = load_settings()
@@ -212,30 +740,64 @@ class WebcamApp(QWidget):
         # Initialize the UI
         self.init_ui()
 
+        if not styles_ready:
+            self._style_discovery_signals = StyleDiscoverySignals(self)
+            self._style_discovery_signals.loaded.connect(self._on_styles_loaded)
+            QThreadPool.globalInstance().start(StyleDiscoveryTask(self._style_discovery_signals))
+
+    def _on_styles_loaded(self, style_instances, style_categories):
+        """Install the styles found by the background discovery task."""
+        self.style_instances, self.style_categories = style_instances, style_categories
+        self.style_tab_manager.update_styles(style_categories, style_instances)
+        # Validates the new styles' settings and refreshes the parameter controls
+        self.validate_and_load_settings()
+
     def validate_and_load_settings(self):
         """Validate and load settings, resetting invalid parameters as needed."""
-        for style_name, style_instance in self.style_instances.items():
-            style_params = self.settings.get("parameters", {}).get(style_name, {})
+        # Styles still pending in the lazy dict are checked the first time they
+        # are selected (see update_parameter_controls).
+        loaded = self.style_instances.loaded_items()
+        styles = list(loaded)
+        self._validated_styles.update(name for name, _ in styles)
+        stored = self.settings.setdefault("parameters", {})
+        # Parameters that already passed validation for these same styles and
+        # parameter definitions (the digest saved last time still matches) are
+        # not checked again.
+        saved_digest = self.settings.get("_params_digest")
+        if saved_digest is not None and saved_digest == _settings_digest(stored, styles):
+            loaded = []
+        validated = []
+        for style_name, style_instance in loaded:
+            style_params = stored.get(style_name, {})
             try:
                 validated_params = style_instance.validate_params(style_params)
             except Exception as e:
                 logging.warning(f"Invalid parameters for style '{style_name}': {e}. Resetting to defaults.")
                 # Reset to defaults using normalized parameters
-                validated_params = {
-                    param['name']: param.get("default", 0)
-                    for param in style_instance.parameters
-                }
-            # For 'file' type parameters, if the path no longer exists, reset to default
-            for param in style_instance.parameters:
-                if param.get("type") == "file":
-                    file_path = validated_params.get(param["name"], "")
-                    if file_path and not os.path.exists(file_path):
-                        logging.warning(
-                            f"File for parameter '{param['name']}' not found at '{file_path}'. Resetting to default '{param.get('default', '')}'."
-                        )
-                        validated_params[param['name']] = param.get("default", "")
-            self.settings["parameters"][style_name] = validated_params
-        save_settings(self.settings)
+                validated_params = dict(style_instance.default_params)
+            validated.append((style_name, validated_params, style_instance.file_parameters))
+
+        # Stat every referenced file once, then reset the ones that are gone
+        changed = False
+        exists = _paths_exist(
+            params.get(param["name"], "") for _, params, file_params in validated for param in file_params
+        )
+        for style_name, validated_params, file_params in validated:
+            for param in file_params:
+                file_path = validated_params.get(param["name"], "")
+                if file_path and not exists[file_path]:
+                    logging.warning(
+                        f"File for parameter '{param['name']}' not found at '{file_path}'. Resetting to default '{param.get('default', '')}'."
+                    )
+                    validated_params[param['name']] = param.get("default", "")
+            if stored.get(style_name) != validated_params:
+                stored[style_name] = validated_params
+                changed = True
+        # Usually nothing changed; don't rewrite the same config on every start
+        digest = _settings_digest(stored, styles)
+        if changed or digest != saved_digest:
+            self.settings["_params_digest"] = digest
+            save_settings(self.settings)
         # If the UI is initialized, update controls to reflect any changed defaults (e.g. file paths)
         if hasattr(self, 'parameter_controls'):
             self.update_parameter_controls()
@@ -243,21 +805,25 @@ class WebcamApp(QWidget):
     def init_ui(self):
         layout = QVBoxLayout()
 
-        # 1) Device Selector
-        devices = list_devices() or ["Enter device manually..."]
+        # 1) Device Selector: show the last known devices right away and
+        # re-probe in the background when they are out of date
+        devices, fresh = cached_devices()
+        devices = devices or ["Enter device manually..."]
         default_device = self.settings.get("input_device", devices[0] if devices else "")
-        device_selector = DeviceSelector(self, devices, default_device)
-        layout.addLayout(device_selector.create())
-        self.device_combo = device_selector.device_combo
+        self.device_selector = DeviceSelector(self, devices, default_device)
+        layout.addLayout(self.device_selector.create(self.refresh_devices))
+        self.device_combo = self.device_selector.device_combo
+        if not fresh:
+            self._start_device_probe()
 
         # 2) Style Selector with Categories
-        style_tab_manager = StyleTabManager(self, self.style_categories, self.style_instances, self.settings)
+        style_tab_manager = StyleTabManager(
+            self, self.style_categories, self.style_instances,
+            current_style=self.settings.get("style"), on_change=self._on_style_changed
+        )
         layout.addWidget(style_tab_manager)
         self.style_tab_manager = style_tab_manager
 
-        # Connect style change to parameter update
-        style_tab_manager.style_changed.connect(self.update_parameter_controls)
-
         # 3) Parameter Controls
         self.parameter_controls = ParameterControls(self)
         layout.addWidget(self.parameter_controls)
@@ -295,6 +861,8 @@ class WebcamApp(QWidget):
         self.max_fps_slider.setValue(30)
         self.max_fps_label = QLabel("30")
         self.max_fps_slider.valueChanged.connect(lambda v: self.max_fps_label.setText(str(v)))
+        self.max_fps_slider.valueChanged.connect(self.on_performance_changed)
+        self.max_fps_slider.sliderReleased.connect(self.on_performance_changed)
         performance_layout.addRow("Max FPS:", self.max_fps_slider)
         performance_layout.addRow("", self.max_fps_label)
         
@@ -304,6 +872,8 @@ class WebcamApp(QWidget):
         self.frame_skip_slider.setValue(0)
         self.frame_skip_label = QLabel("0")
         self.frame_skip_slider.valueChanged.connect(lambda v: self.frame_skip_label.setText(str(v)))
+        self.frame_skip_slider.valueChanged.connect(self.on_performance_changed)
+        self.frame_skip_slider.sliderReleased.connect(self.on_performance_changed)
         performance_layout.addRow("Frame Skip:", self.frame_skip_slider)
         performance_layout.addRow("", self.frame_skip_label)
         
@@ -317,36 +887,67 @@ class WebcamApp(QWidget):
 
         self.setLayout(layout)
 
+    def refresh_devices(self):
+        """Re-run device discovery in the background, bypassing the cached list."""
+        self._start_device_probe(refresh=True)
+
+    def _start_device_probe(self, refresh=False):
+        self.device_selector.refresh_button.setEnabled(False)
+        QThreadPool.globalInstance().start(DeviceProbeTask(self._device_probe_signals, refresh))
+
+    def _on_devices_found(self, devices):
+        """Show the devices found by a DeviceProbeTask."""
+        self.device_selector.set_devices(devices or ["Enter device manually..."])
+        self.device_selector.refresh_button.setEnabled(True)
+
+    def _on_style_changed(self, style_name):
+        """Show the selected style's parameters; it is saved when the camera starts."""
+        self.update_parameter_controls()
+
     def update_parameter_controls(self):
         """Update parameter controls based on the selected style."""
         selected_style_name = self.style_tab_manager.get_current_style()
         self.current_style = self.style_instances.get(selected_style_name, Original())
 
-        saved_params = self.settings.get("parameters", {})
-        self.current_style_params = saved_params.get(selected_style_name, {}).copy()
+        saved_params = self.settings.get("parameters", {}).get(selected_style_name, {})
+        self.current_style_params = dict(saved_params)
 
         if self.current_style:
             logging.info(f"Updating parameters for style: {selected_style_name}")
 
-            # Ensure all parameters have default values if missing
-            for param in self.current_style.parameters:
-                if param["name"] not in self.current_style_params:
-                    self.current_style_params[param["name"]] = param.get("default", 0)
+            dirty = False
+            if selected_style_name in self._validated_styles:
+                # Saved values over defaults, in one merge
+                self.current_style_params = {**self.current_style.default_params, **saved_params}
+            else:
+                # First use of a style loaded after startup: validate it once
+                try:
+                    self.current_style_params = self.current_style.validate_params(saved_params)
+                except Exception as e:
+                    logging.warning(f"Invalid parameters for style '{selected_style_name}': {e}. Resetting to defaults.")
+                    self.current_style_params = dict(self.current_style.default_params)
+                self._validated_styles.add(selected_style_name)
+                if self.current_style_params != saved_params:
+                    self.settings.setdefault('parameters', {})[selected_style_name] = dict(self.current_style_params)
+                    dirty = True
             # For 'file' parameters, if the path no longer exists (e.g. file moved), reset to default to update GUI
-            for param in self.current_style.parameters:
-                if param.get("type") == "file":
-                    current_path = self.current_style_params.get(param["name"], "")
-                    if current_path and not os.path.exists(current_path):
-                        logging.info(
-                            f"File for parameter '{param['name']}' not found at '{current_path}', resetting to default '{param.get('default','')}'"
-                        )
-                        # Reset internal state and update settings
-                        new_default = param.get('default', '')
-                        self.current_style_params[param['name']] = new_default
-                        # Persist change
-                        style_name = self.style_tab_manager.get_current_style()
-                        self.settings['parameters'][style_name][param['name']] = new_default
-                        save_settings(self.settings)
+            file_params = self.current_style.file_parameters
+            exists = _paths_exist(self.current_style_params.get(param["name"], "") for param in file_params)
+            for param in file_params:
+                current_path = self.current_style_params.get(param["name"], "")
+                if current_path and not exists[current_path]:
+                    logging.info(
+                        f"File for parameter '{param['name']}' not found at '{current_path}', resetting to default '{param.get('default','')}'"
+                    )
+                    # Reset internal state and update settings
+                    new_default = param.get('default', '')
+                    self.current_style_params[param['name']] = new_default
+                    style_settings = self.settings.setdefault('parameters', {}).setdefault(selected_style_name, {})
+                    style_settings[param['name']] = new_default
+                    dirty = True
+            # Persist all resets with one (coalesced) write
+            if dirty:
+                save_settings(self.settings)
 
             # Update controls based on normalized parameters list
             self.parameter_controls.update_parameters(
@@ -384,19 +985,49 @@ class WebcamApp(QWidget):
                     widget.setText(str(value))
             except Exception as e:
                 logging.error(f"Failed to update label for '{param_name}': {e}")
-        elif isinstance(widget, QComboBox):
-            logging.debug(f"ComboBox '{param_name}' changed to '{value}'")
-        elif isinstance(widget, QCheckBox):
-            logging.debug(f"Checkbox '{param_name}' changed to '{value}'")
-        else:
-            logging.debug(f"Parameter '{param_name}' updated to {value} (widget={type(widget)})")
+        elif logger.isEnabledFor(logging.DEBUG):
+            # Runs on every slider tick: skip formatting unless it is logged
+            if isinstance(widget, QComboBox):
+                logger.debug("ComboBox '%s' changed to '%s'", param_name, value)
+            elif isinstance(widget, QCheckBox):
+                logger.debug("Checkbox '%s' changed to '%s'", param_name, value)
+            else:
+                logger.debug("Parameter '%s' updated to %s (widget=%s)", param_name, value, type(widget))
+
+        # If the webcam thread is running, update parameters on the fly. A
+        # drag fires many ticks per frame, so send at most one update per
+        # timer interval, carrying whatever values are current when it fires.
+        if self.thread and self.thread.isRunning() and not self._params_timer.isActive():
+            self._params_timer.start()
+
+    def on_performance_changed(self):
+        """
+        Push Max FPS / Frame Skip to the running thread. While a slider is
+        dragged only its label follows; the value is sent once on release
+        (keyboard and wheel steps are sent right away).
+        """
+        slider = self.sender()
+        if isinstance(slider, QSlider) and slider.isSliderDown():
+            return
+        if self.thread and self.thread.isRunning() and not self._params_timer.isActive():
+            self._params_timer.start()
 
-        # If the webcam thread is running, update parameters on the fly
+    def _flush_params(self):
+        """Push the current style parameters to the running webcam thread."""
         if self.thread and self.thread.isRunning():
-            thread_params = dict(self.current_style_params)
-            thread_params['max_fps'] = self.max_fps_slider.value()
-            thread_params['frame_skip'] = self.frame_skip_slider.value()
-            self.thread.update_params(thread_params)
+            self.thread.update_params(self._thread_params())
+
+    def _thread_params(self):
+        """
+        Read-only snapshot of the style and performance parameters for the
+        webcam thread. Nothing else references the dict behind it, so the
+        thread can keep it as-is instead of copying.
+        """
+        return MappingProxyType({
+            **self.current_style_params,
+            'max_fps': self.max_fps_slider.value(),
+            'frame_skip': self.frame_skip_slider.value(),
+        })
 
     def start_virtual_camera(self):
         """Starts the WebcamThread to capture frames via PyAV and stream them."""
@@ -419,16 +1050,12 @@ class WebcamApp(QWidget):
         self.settings["parameters"][selected_style] = self.current_style_params
         save_settings(self.settings)
 
-        # Add performance parameters to style params
-        thread_params = dict(self.current_style_params)
-        thread_params['max_fps'] = self.max_fps_slider.value()
-        thread_params['frame_skip'] = self.frame_skip_slider.value()
-        
-        # Initialize and start the thread
+        # Initialize and start the thread with style + performance parameters
         self.thread = WebcamThread(
             input_device=input_device,
-            style_instance=self.style_instances[selected_style],
-            style_params=thread_params
+            # Styles may still be loading (or failed to load): fall back like the controls do
+            style_instance=self.style_instances.get(selected_style) or self.current_style or Original(),
+            style_params=self._thread_params()
         )
         self.thread.error_signal.connect(self.display_error)
         self.thread.info_signal.connect(self.display_info)
@@ -448,6 +1075,8 @@ class WebcamApp(QWidget):
             self.thread = None
             self.status_label.setText("Status: Stopped")
             logging.info("Virtual camera stopped.")
+            # A natural checkpoint: persist this session's tweaks now
+            flush_settings()
 
         # Update button states
         self.action_buttons.start_button.setEnabled(True)
@@ -469,9 +1098,18 @@ class WebcamApp(QWidget):
         default_path = os.path.join(self.snapshot_dir, "snapshot.png")
         save_path, _ = QFileDialog.getSaveFileName(self, "Save Snapshot", default_path, "Image Files (*.png *.jpg *.bmp)")
         if save_path:
-            cv2.imwrite(save_path, self.thread.last_frame)
-            QMessageBox.information(self, "Snapshot", f"Snapshot saved to:\n{save_path}")
-            logging.info(f"Snapshot saved to: {save_path}")
+            # last_frame is never written in place (the thread replaces it each
+            # frame), so the worker can read it without copying.
+            self._snapshot_pool.start(
+                SnapshotWriter(self.thread.last_frame, save_path, self._snapshot_signals)
+            )
+
+    def on_snapshot_saved(self, save_path):
+        QMessageBox.information(self, "Snapshot", f"Snapshot saved to:\n{save_path}")
+        logging.info(f"Snapshot saved to: {save_path}")
+
+    def on_snapshot_failed(self, save_path):
+        show_error_dialog(self, f"Could not save snapshot to:\n{save_path}")
 
     def display_error(self, message, exc=None):
         """Show error messages via a dialog and stop the thread."""
@@ -516,29 +1154,56 @@ class WebcamApp(QWidget):
             show_error_dialog(self, f"Optimization failed: {e}", exc=e)
 
     def closeEvent(self, event):
-        """Ensure the thread stops when closing the app."""
+        """Ensure the thread stops and settings are saved when closing the app."""
         if self.thread and self.thread.isRunning():
             self.thread.stop()
             logging.info("Application closed. WebcamThread stopped.")
+        flush_settings()
+        if not self._snapshot_pool.waitForDone(SNAPSHOT_WAIT_MS):
+            logging.warning("Closing with a snapshot still being written.")
         event.accept()
 
 # =============================================================================
 # 5. Main Function - App Entry Point
 # =============================================================================
 
-def main():
-    # Setup logging with rotation
+# Log records held in memory before they are written to webcam_app.log
+# (errors are written at once).
+LOG_BUFFER_CAPACITY = 1024
+
+def _configure_logging():
+    """
+    Log at INFO (DEBUG with METUBER_DEBUG=1) to a rotating webcam_app.log,
+    written in batches, and to stdout from a background thread so console
+    output never blocks the GUI.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     file_handler = RotatingFileHandler(
         "webcam_app.log", maxBytes=5 * 1024 * 1024, backupCount=3
     )
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    file_handler.setFormatter(formatter)
+    buffered_file_handler = MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
     stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    stream_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Registered after logging's own shutdown hook, so it runs first
+    atexit.register(listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    # QueueHandler bakes its formatted text into the record; keep that to the
+    # bare message so stream_handler's format is not applied twice.
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     logging.basicConfig(
-        level=logging.DEBUG,
-        handlers=[file_handler, stream_handler]
+        level=logging.DEBUG if DEBUG_MODE else logging.INFO,
+        handlers=[buffered_file_handler, queue_handler]
     )
 
+def main():
+    _configure_logging()
+
     app = QApplication(sys.argv)
     window = WebcamApp()
     window.show()
@@ -1,8 +1,9 @@
 # D:\MeTuber\MeTuber\webcam_threading.py
 
-import av
-import pyvirtualcam
+import importlib
+import importlib.util
 import logging
+import sys
 from PyQt5.QtCore import QThread, pyqtSignal
 import cv2
 import numpy as np
@@ -10,11 +11,48 @@ import os
 import traceback
 import time
 import queue
-from collections import deque
+import threading
+from types import MappingProxyType
+
+from styles.base import CUDA_AVAILABLE, OPENCL_AVAILABLE, Style
+from styles.registry import get_processor
 
 DEBUG_MODE = os.environ.get("METUBER_DEBUG", "0") == "1"
 
 
+def _lazy_import(name):
+    """
+    Return module ``name``, deferring its execution to the first attribute
+    access (importlib's LazyLoader). Already imported modules are returned
+    as they are; a missing module still raises ImportError right away.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return importlib.import_module(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# PyAV and pyvirtualcam load their native libraries only once a WebcamThread
+# is created, so opening the GUI does not pay for them.
+av = _lazy_import("av")
+pyvirtualcam = _lazy_import("pyvirtualcam")
+
+# Decoded frames waiting for the style stage. Kept tiny so a stalled style
+# drops camera frames instead of building up latency.
+FRAME_QUEUE_SIZE = 2
+
+# Decoder threads per frame (slice threading); half the cores, at least two.
+DECODE_THREADS = max(2, (os.cpu_count() or 2) // 2)
+# Longest stop() waits for the capture loop to exit.
+STOP_WAIT_MS = 3000
+
+
 class WebcamThread(QThread):
     """
     A QThread that captures video frames using PyAV, applies the chosen style,
@@ -30,6 +68,21 @@ class WebcamThread(QThread):
         self.input_device = input_device
         self.style_instance = style_instance
         self.style_params = style_params
+        self._processor = None
+        self._processor_output_owned = False
+        self._resolve_processor()
+        # Latest-wins slot from update_params() (GUI thread) to the style worker.
+        # One producer and one consumer, so no lock: the producer stores the
+        # new parameters, then bumps the sequence number; the worker applies
+        # them when the number differs from the last one it saw.
+        self._params_ref = [None]
+        self._params_seq = 0
+        self._seen_params_seq = 0
+        # Device buffers for _fit_to_camera, allocated on the first CUDA resize
+        self._gpu_in = self._gpu_out = None
+        self._use_cuda_resize = CUDA_AVAILABLE
+        # Cleared if this PyAV's to_ndarray() has no threads argument
+        self._single_thread_reformat = True
         self.running = False
         self.last_frame = None
         self.logger = logging.getLogger(__name__)
@@ -64,9 +117,7 @@ class WebcamThread(QThread):
         self.frame_skip = 0  # Skip every Nth frame (0 = no skip)
         self.frame_count = 0
         self.last_frame_time = 0
-        
-        # Frame queue to prevent buffer buildup
-        self.frame_queue = deque(maxlen=5)  # Only keep 5 frames max
+        self.frames_processed = 0
         
         # PyAV input options to reduce buffer size aggressively
         self.input_options = {
@@ -86,6 +137,7 @@ class WebcamThread(QThread):
         """
         self.logger.info("WebcamThread started.")
         self.info_signal.emit("Webcam thread started.")
+        self._resolve_processor()
         
         try:
             # Open input stream with aggressive buffer management options
@@ -97,7 +149,7 @@ class WebcamThread(QThread):
             
             # Get video stream
             video_stream = input_stream.streams.video[0]
-            video_stream.thread_type = 'AUTO'  # Use threading for decoding
+            self._configure_decoder(video_stream)
             
             # Set up virtual camera with lower FPS
             target_fps = min(self.max_fps, 15)  # Cap at 15 FPS to reduce load
@@ -106,69 +158,66 @@ class WebcamThread(QThread):
                 self.info_signal.emit(f"Virtual camera ready: {video_stream.width}x{video_stream.height}")
                 
                 frame_interval = 1.0 / target_fps
-                frames_processed = 0
                 frames_dropped = 0
                 last_stats_time = time.time()
-                
-                for frame in input_stream.decode(video=0):
-                    if not self.running:
-                        break
-                    
-                    # Aggressive frame rate limiting
-                    current_time = time.time()
-                    if current_time - self.last_frame_time < frame_interval:
-                        frames_dropped += 1
-                        continue
-                    
-                    # Frame skipping
-                    self.frame_count += 1
-                    if self.frame_skip > 0 and self.frame_count % (self.frame_skip + 1) != 0:
-                        frames_dropped += 1
-                        continue
-                    
-                    # Queue management - drop old frames if queue is full
-                    if len(self.frame_queue) >= 3:  # Keep queue small
+                self.frames_processed = 0
+                processed_at_last_stats = 0
+
+                # Decoding runs here while a worker applies the style and sends
+                # to the camera. Apply and send share a stage because styles
+                # return pooled buffers that their next apply() overwrites.
+                frame_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+                worker = threading.Thread(
+                    target=self._process_frames, args=(frame_queue, cam),
+                    name="WebcamThread-style", daemon=True
+                )
+                worker.start()
+                try:
+                    for frame in input_stream.decode(video=0):
+                        if not self.running:
+                            break
+
+                        # Aggressive frame rate limiting
+                        current_time = time.time()
+                        if current_time - self.last_frame_time < frame_interval:
+                            frames_dropped += 1
+                            continue
+
+                        # Frame skipping
+                        self.frame_count += 1
+                        if self.frame_skip > 0 and self.frame_count % (self.frame_skip + 1) != 0:
+                            frames_dropped += 1
+                            continue
+
                         try:
-                            self.frame_queue.popleft()  # Drop oldest frame
+                            # Convert frame to numpy array
+                            frame_array = self._frame_to_bgr(frame)
+                        except Exception as frame_error:
+                            self.logger.warning(f"Frame decode error: {frame_error}")
+                            frames_dropped += 1
+                            continue
+
+                        # Hand off to the style stage, dropping the oldest frame if it is behind
+                        if self._enqueue_latest(frame_queue, frame_array):
                             frames_dropped += 1
-                        except IndexError:
-                            pass
-                    
-                    try:
-                        # Convert frame to numpy array
-                        frame_array = frame.to_ndarray(format='bgr24')
-                        
-                        # Add to queue
-                        self.frame_queue.append(frame_array)
-                        
-                        # Apply style
-                        if self.style_instance:
-                            processed_frame = self.style_instance.apply(frame_array, self.style_params)
-                        else:
-                            processed_frame = frame_array
-                        
-                        # Send to virtual camera
-                        cam.send(processed_frame)
-                        cam.sleep_until_next_frame()
-                        
-                        # Store last frame for snapshot
-                        self.last_frame = processed_frame.copy()
                         self.last_frame_time = current_time
-                        frames_processed += 1
-                        
+
                         # Log stats every 5 seconds
                         if current_time - last_stats_time > 5.0:
-                            self.logger.info(f"Buffer stats: {frames_processed} processed, {frames_dropped} dropped")
-                            frames_processed = 0
+                            # frames_processed is only ever incremented by the worker
+                            processed = self.frames_processed
+                            self.logger.info(
+                                f"Buffer stats: {processed - processed_at_last_stats} processed, {frames_dropped} dropped"
+                            )
+                            processed_at_last_stats = processed
                             frames_dropped = 0
                             last_stats_time = current_time
-                        
-                    except Exception as frame_error:
-                        self.logger.warning(f"Frame processing error: {frame_error}")
-                        frames_dropped += 1
-                        # Continue processing other frames
-                        continue
-                        
+                finally:
+                    # Let the worker drain what is queued, then stop it. Never
+                    # block here: a dead worker leaves the queue full.
+                    self._enqueue_latest(frame_queue, None)
+                    worker.join()
+
         except av.EOFError:
             self.logger.info("End of video stream reached.")
             self.info_signal.emit("Video stream ended.")
@@ -188,18 +237,193 @@ class WebcamThread(QThread):
                 input_stream.close()
             except:
                 pass
+            # Updates apply directly again; pick up any the worker never saw
+            self.running = False
+            self._take_pending_params()
             self.logger.info("WebcamThread stopped.")
 
+    def _frame_to_bgr(self, frame):
+        """
+        Convert a decoded frame to a BGR array with a single swscale thread.
+
+        PyAV 17+ converts with a thread team by default, whose start-up costs
+        more than it saves on one webcam frame. Older versions reject the
+        ``threads`` argument, but they convert on one thread anyway.
+        """
+        if self._single_thread_reformat:
+            try:
+                return frame.to_ndarray(format='bgr24', threads=1)
+            except TypeError:
+                self._single_thread_reformat = False
+        return frame.to_ndarray(format='bgr24')
+
+    @staticmethod
+    def _configure_decoder(video_stream):
+        """
+        Decode each frame with several slice threads and in low-delay mode.
+
+        Frame threading (part of 'AUTO') decodes several frames at once and so
+        holds back one frame per thread, which is latency a live feed cannot
+        afford; slice threading splits a single frame instead.
+        """
+        video_stream.thread_type = 'SLICE'
+        video_stream.thread_count = DECODE_THREADS
+        try:
+            flags = av.codec.context.Flags
+            # Renamed from LOW_DELAY to low_delay in newer PyAV releases
+            low_delay = getattr(flags, 'low_delay', None) or flags.LOW_DELAY
+            video_stream.codec_context.flags |= low_delay
+        except (AttributeError, TypeError, ValueError) as e:
+            logging.getLogger(__name__).debug(f"Low-delay decoding unavailable: {e}")
+
+    @staticmethod
+    def _enqueue_latest(frame_queue, frame_array):
+        """
+        Queue a frame without blocking, evicting the oldest one if the queue is full.
+
+        Returns:
+            bool: True if a queued frame was dropped to make room.
+        """
+        try:
+            frame_queue.put_nowait(frame_array)
+            return False
+        except queue.Full:
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            # Single producer: the slot just freed cannot be taken by anyone else
+            frame_queue.put_nowait(frame_array)
+            return True
+
+    def _process_frames(self, frame_queue, cam):
+        """
+        Style stage: apply the style to queued frames and send them to the camera.
+
+        Runs on a worker thread until a None sentinel is queued. OpenCV releases
+        the GIL, so this overlaps with decoding on the capture thread.
+        """
+        while True:
+            frame_array = frame_queue.get()
+            if frame_array is None:
+                break
+            try:
+                self._take_pending_params()
+                # Apply style. Decoded frames are fresh arrays, but a style may
+                # return a pooled buffer that its next frame overwrites.
+                if self._processor is not None:
+                    styled_frame = self._processor(frame_array)
+                    owned = self._processor_output_owned
+                elif self.style_instance:
+                    styled_frame = self.style_instance.apply(frame_array, self.style_params)
+                    owned = False
+                else:
+                    styled_frame = frame_array
+                    owned = True
+
+                # Send to virtual camera
+                processed_frame = self._fit_to_camera(styled_frame, cam)
+                owned = owned or processed_frame is not styled_frame
+                cam.send(processed_frame)
+                cam.sleep_until_next_frame()
+
+                # Store last frame for snapshot; only a pooled buffer needs copying
+                self.last_frame = processed_frame if owned else processed_frame.copy()
+                self.frames_processed += 1
+            except Exception as frame_error:
+                self.logger.warning(f"Frame processing error: {frame_error}")
+
+    def _fit_to_camera(self, frame, cam):
+        """
+        Return ``frame`` as the 3-channel image at the camera's resolution.
+
+        Frames that already fit (the usual case, since the camera is opened at
+        the input's size) are returned untouched. Grayscale style output is
+        expanded to three channels, and other sizes are resized, on the GPU
+        when OpenCV has a CUDA device, otherwise on the CPU.
+        """
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        if frame.shape[:2] == (cam.height, cam.width):
+            return frame
+        size = (cam.width, cam.height)
+        if self._use_cuda_resize:
+            try:
+                if self._gpu_in is None:
+                    self._gpu_in, self._gpu_out = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+                self._gpu_in.upload(frame)
+                cv2.cuda.resize(self._gpu_in, size, dst=self._gpu_out, interpolation=cv2.INTER_LINEAR)
+                return self._gpu_out.download()
+            except cv2.error as e:
+                self.logger.warning(f"CUDA resize failed, resizing on the CPU from now on: {e}")
+                self._use_cuda_resize = False
+        return cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR)
+
     def update_params(self, new_params):
-        """Update style parameters and buffer settings."""
-        self.style_params = new_params
+        """
+        Update style parameters and buffer settings.
+
+        A read-only ``MappingProxyType`` snapshot is kept by reference; any
+        other mapping is copied, so callers may reuse and mutate their dict
+        while frames are being processed. While the thread runs, the style
+        worker applies only the most recent set, before its next frame, so a
+        burst of updates costs one processor rebuild.
+        """
+        params = new_params if isinstance(new_params, MappingProxyType) else dict(new_params)
+        if self.running:
+            self._params_ref[0] = params
+            self._params_seq += 1
+        else:
+            self.style_params = params
+            self._resolve_processor()
         # Allow frame rate control via parameters
         if 'max_fps' in new_params:
             self.max_fps = max(1, min(60, new_params['max_fps']))
         if 'frame_skip' in new_params:
             self.frame_skip = max(0, min(10, new_params['frame_skip']))
 
+    def _take_pending_params(self):
+        """Apply the latest queued parameters, if any. Called by the style worker."""
+        seq = self._params_seq
+        if seq != self._seen_params_seq:
+            # Read after seq: a newer set may be picked up early, never an older one
+            self._seen_params_seq = seq
+            self.style_params = self._params_ref[0]
+            self._resolve_processor()
+
+    def _resolve_processor(self):
+        """Pick the specialized per-frame processor for the current style, if any."""
+        style, params = self.style_instance, self.style_params
+        if isinstance(style, Style) and style.use_umat and OPENCL_AVAILABLE:
+            # Keep the frame on the OpenCL device for the whole style
+            self._processor = lambda image: style.process(image, params)
+            self._processor_output_owned = False
+            return
+        processor = None
+        if isinstance(style, Style) and params is not None:
+            processor = get_processor(style, params)
+        # Registry processors always return a new array
+        self._processor_output_owned = processor is not None
+        if processor is None and isinstance(style, Style):
+            # Validate once per parameter change instead of once per frame
+            try:
+                processor = style.bind(params)
+            except Exception as e:
+                # Leave it to apply() so the error surfaces per frame as before
+                logging.getLogger(__name__).debug(f"Could not bind style parameters: {e}")
+        self._processor = processor
+
+    def start(self, *args, **kwargs):
+        """
+        Start the thread. ``running`` is set here rather than in run(), so a
+        stop() issued before run() begins is never undone.
+        """
+        self.running = True
+        super().start(*args, **kwargs)
+
     def stop(self):
         """Stop the thread."""
         self.running = False
-        self.wait()  # Wait for thread to finish
+        # Wait for thread to finish, but never hang the caller on a stuck device
+        if not self.wait(STOP_WAIT_MS):
+            self.logger.warning("WebcamThread did not stop in time.")